@@ -1,4 +1,4 @@
-"""File browser dialog for FastGH."""
+"""File browser dialog and panel for FastGH."""
 
 import wx
 import webbrowser
@@ -10,10 +10,14 @@ from models.content import ContentItem
 from . import theme
 
 
-class FileBrowserDialog(wx.Dialog):
-    """Dialog for browsing repository files."""
+class FileBrowserPanel(wx.Panel):
+    """Panel for browsing repository files.
+
+    Used by FileBrowserDialog and embedded as a tab in the repository view.
+    """
 
     def __init__(self, parent, repo: Repository):
+        wx.Panel.__init__(self, parent)
         self.repo = repo
         self.app = get_app()
         self.account = self.app.currentAccount
@@ -21,70 +25,61 @@ class FileBrowserDialog(wx.Dialog):
         self.path_history = []  # Stack for back navigation
         self.contents: list[ContentItem] = []
 
-        title = f"Files: {repo.full_name}"
-        wx.Dialog.__init__(self, parent, title=title, size=(700, 500))
-
         self.init_ui()
         self.bind_events()
-        theme.apply_theme(self)
 
         # Load root directory
         self.load_contents("")
 
     def init_ui(self):
         """Initialize UI."""
-        self.panel = wx.Panel(self)
         main_sizer = wx.BoxSizer(wx.VERTICAL)
 
         # Path bar
         path_sizer = wx.BoxSizer(wx.HORIZONTAL)
 
-        self.back_btn = wx.Button(self.panel, label="&Back")
+        self.back_btn = wx.Button(self, label="&Back")
         self.back_btn.Enable(False)
         path_sizer.Add(self.back_btn, 0, wx.RIGHT, 5)
 
-        self.home_btn = wx.Button(self.panel, label="&Root")
+        self.home_btn = wx.Button(self, label="&Root")
         path_sizer.Add(self.home_btn, 0, wx.RIGHT, 10)
 
-        path_label = wx.StaticText(self.panel, label="Path:")
+        path_label = wx.StaticText(self, label="Path:")
         path_sizer.Add(path_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
 
-        self.path_text = wx.TextCtrl(self.panel, style=wx.TE_READONLY)
+        self.path_text = wx.TextCtrl(self, style=wx.TE_READONLY)
         self.path_text.SetValue("/")
         path_sizer.Add(self.path_text, 1, wx.EXPAND)
 
         main_sizer.Add(path_sizer, 0, wx.EXPAND | wx.ALL, 10)
 
         # File list
-        self.file_list = wx.ListBox(self.panel, style=wx.LB_SINGLE)
+        self.file_list = wx.ListBox(self, style=wx.LB_SINGLE)
         main_sizer.Add(self.file_list, 1, wx.EXPAND | wx.LEFT | wx.RIGHT, 10)
 
         # Status bar
-        self.status_text = wx.StaticText(self.panel, label="")
+        self.status_text = wx.StaticText(self, label="")
         main_sizer.Add(self.status_text, 0, wx.ALL, 10)
 
         # Buttons
         btn_sizer = wx.BoxSizer(wx.HORIZONTAL)
 
-        self.view_btn = wx.Button(self.panel, label="&View")
+        self.view_btn = wx.Button(self, label="&View")
         btn_sizer.Add(self.view_btn, 0, wx.RIGHT, 5)
 
-        self.open_btn = wx.Button(self.panel, label="&Open in Browser")
+        self.open_btn = wx.Button(self, label="&Open in Browser")
         btn_sizer.Add(self.open_btn, 0, wx.RIGHT, 5)
 
-        self.copy_url_btn = wx.Button(self.panel, label="Copy &URL")
-        btn_sizer.Add(self.copy_url_btn, 0, wx.RIGHT, 5)
-
-        self.close_btn = wx.Button(self.panel, wx.ID_CANCEL, label="&Close")
-        btn_sizer.Add(self.close_btn, 0)
+        self.copy_url_btn = wx.Button(self, label="Copy &URL")
+        btn_sizer.Add(self.copy_url_btn, 0)
 
         main_sizer.Add(btn_sizer, 0, wx.ALL | wx.ALIGN_CENTER, 10)
 
-        self.panel.SetSizer(main_sizer)
+        self.SetSizer(main_sizer)
 
     def bind_events(self):
         """Bind event handlers."""
-        self.Bind(wx.EVT_CLOSE, self.on_close)
         self.Bind(wx.EVT_CHAR_HOOK, self.on_char_hook)
         self.back_btn.Bind(wx.EVT_BUTTON, self.on_back)
         self.home_btn.Bind(wx.EVT_BUTTON, self.on_home)
@@ -92,14 +87,11 @@ class FileBrowserDialog(wx.Dialog):
         self.view_btn.Bind(wx.EVT_BUTTON, self.on_view)
         self.open_btn.Bind(wx.EVT_BUTTON, self.on_open_browser)
         self.copy_url_btn.Bind(wx.EVT_BUTTON, self.on_copy_url)
-        self.close_btn.Bind(wx.EVT_BUTTON, self.on_close)
 
     def on_char_hook(self, event):
         """Handle key events."""
         key = event.GetKeyCode()
-        if key == wx.WXK_ESCAPE:
-            self.on_close(None)
-        elif key == wx.WXK_RETURN or key == wx.WXK_NUMPAD_ENTER:
+        if key == wx.WXK_RETURN or key == wx.WXK_NUMPAD_ENTER:
             self.activate_selected()
         elif key == wx.WXK_BACK:
             if self.path_history:
@@ -216,6 +208,46 @@ class FileBrowserDialog(wx.Dialog):
                 wx.TheClipboard.Close()
                 wx.MessageBox(f"Copied: {item.html_url}", "Copied", wx.OK | wx.ICON_INFORMATION)
 
+
+class FileBrowserDialog(wx.Dialog):
+    """Dialog for browsing repository files."""
+
+    def __init__(self, parent, repo: Repository):
+        self.repo = repo
+
+        title = f"Files: {repo.full_name}"
+        wx.Dialog.__init__(self, parent, title=title, size=(700, 500))
+
+        self.init_ui()
+        self.bind_events()
+        theme.apply_theme(self)
+
+    def init_ui(self):
+        """Initialize UI."""
+        self.panel = wx.Panel(self)
+        main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        self.browser = FileBrowserPanel(self.panel, self.repo)
+        main_sizer.Add(self.browser, 1, wx.EXPAND)
+
+        self.close_btn = wx.Button(self.panel, wx.ID_CANCEL, label="&Close")
+        main_sizer.Add(self.close_btn, 0, wx.BOTTOM | wx.ALIGN_CENTER, 10)
+
+        self.panel.SetSizer(main_sizer)
+
+    def bind_events(self):
+        """Bind event handlers."""
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        self.Bind(wx.EVT_CHAR_HOOK, self.on_char_hook)
+        self.close_btn.Bind(wx.EVT_BUTTON, self.on_close)
+
+    def on_char_hook(self, event):
+        """Handle key events."""
+        if event.GetKeyCode() == wx.WXK_ESCAPE:
+            self.on_close(None)
+        else:
+            event.Skip()
+
     def on_close(self, event):
         """Handle close."""
         self.EndModal(wx.ID_CANCEL)
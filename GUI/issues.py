@@ -255,7 +255,7 @@ class IssuesDialog(wx.Dialog):
 class ViewIssueDialog(wx.Dialog):
     """Dialog for viewing issue details."""
 
-    def __init__(self, parent, repo: Repository, issue: Issue):
+    def __init__(self, parent, repo: Repository, issue: Issue, comments: list = None):
         self.repo = repo
         self.issue = issue
         self.app = get_app()
@@ -271,8 +271,11 @@ class ViewIssueDialog(wx.Dialog):
         self.bind_events()
         theme.apply_theme(self)
 
-        # Load comments
-        self.load_comments()
+        # Load comments unless they came with the issue
+        if comments is None:
+            self.load_comments()
+        else:
+            self.update_comments(comments)
 
     def init_ui(self):
         """Initialize the UI."""
@@ -437,21 +437,21 @@ class MainGui(wx.Frame):
     def _open_feed_issue(self, owner: str, repo_name: str, number: int):
         """Open an issue from the feed."""
         def fetch_and_show():
-            issue = self.app.currentAccount.get_issue(owner, repo_name, number)
+            issue, comments = self.app.currentAccount.get_issue_bundle(owner, repo_name, number)
             repo = self.app.currentAccount.get_repo(owner, repo_name)
             if issue and repo:
-                wx.CallAfter(self._show_issue_dialog, repo, issue)
+                wx.CallAfter(self._show_issue_dialog, repo, issue, comments)
             else:
                 wx.CallAfter(wx.MessageBox, f"Could not load issue #{number}", "Error", wx.OK | wx.ICON_ERROR)
 
         self.status_bar.SetStatusText(f"Loading issue #{number}...")
         threading.Thread(target=fetch_and_show, daemon=True).start()
 
-    def _show_issue_dialog(self, repo, issue):
+    def _show_issue_dialog(self, repo, issue, comments=None):
         """Show the issue dialog."""
         self.status_bar.SetStatusText("Ready")
         from GUI.issues import ViewIssueDialog
-        dlg = ViewIssueDialog(self, repo, issue)
+        dlg = ViewIssueDialog(self, repo, issue, comments)
         dlg.ShowModal()
         dlg.Destroy()
 
@@ -1106,10 +1106,10 @@ class MainGui(wx.Frame):
     def _open_notification_issue(self, owner: str, repo_name: str, number: int):
         """Open an issue from notification."""
         def fetch_and_show():
-            issue = self.app.currentAccount.get_issue(owner, repo_name, number)
+            issue, comments = self.app.currentAccount.get_issue_bundle(owner, repo_name, number)
             repo = self.app.currentAccount.get_repo(owner, repo_name)
             if issue and repo:
-                wx.CallAfter(self._show_issue_dialog, repo, issue)
+                wx.CallAfter(self._show_issue_dialog, repo, issue, comments)
             else:
                 wx.CallAfter(wx.MessageBox, f"Could not load issue #{number}", "Error", wx.OK | wx.ICON_ERROR)
 
@@ -1330,7 +1330,7 @@ class MainGui(wx.Frame):
         """Copy git clone URL to clipboard."""
         repo = self.get_selected_repo()
         if repo:
-            clone_url = f"https://github.com/{repo.full_name}.git"
+            clone_url = repo.clone_url
             if wx.TheClipboard.Open():
                 wx.TheClipboard.SetData(wx.TextDataObject(clone_url))
                 wx.TheClipboard.Close()
@@ -24,7 +24,7 @@ class OptionsDialog(wx.Dialog):
         self.app = get_app()
         self.parent_window = parent
 
-        wx.Dialog.__init__(self, parent, title="Options", size=(500, 740))
+        wx.Dialog.__init__(self, parent, title="Options", size=(500, 830))
 
         self.init_ui()
         self.bind_events()
@@ -123,6 +123,34 @@ class OptionsDialog(wx.Dialog):
         )
         git_sizer.Add(self.git_recursive_cb, 0, wx.LEFT | wx.BOTTOM, 10)
 
+        self.git_partial_cb = wx.CheckBox(
+            self.panel,
+            label="Use &partial clones (download file history on demand)"
+        )
+        self.git_partial_cb.SetToolTip(
+            "When enabled, git clone will use --filter=blob:none to skip\n"
+            "downloading old file versions until they are needed"
+        )
+        git_sizer.Add(self.git_partial_cb, 0, wx.LEFT | wx.BOTTOM, 10)
+
+        # Parallel fetch jobs row
+        jobs_row = wx.BoxSizer(wx.HORIZONTAL)
+
+        jobs_label = wx.StaticText(self.panel, label="Parallel fetch &jobs:")
+        jobs_row.Add(jobs_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
+
+        self.git_jobs_spin = wx.SpinCtrl(
+            self.panel,
+            min=1,
+            max=32,
+            initial=1,
+            style=wx.SP_ARROW_KEYS
+        )
+        self.git_jobs_spin.SetToolTip("Number of submodules git fetches in parallel")
+        jobs_row.Add(self.git_jobs_spin, 0)
+
+        git_sizer.Add(jobs_row, 0, wx.LEFT | wx.BOTTOM, 10)
+
         main_sizer.Add(git_sizer, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.BOTTOM, 10)
 
         # Notifications section
@@ -222,6 +250,12 @@ class OptionsDialog(wx.Dialog):
 
         appearance_sizer.Add(dark_mode_row, 0, wx.ALL, 10)
 
+        self.repo_view_tabs_cb = wx.CheckBox(
+            self.panel,
+            label="Show repository &files in a tab instead of a separate window"
+        )
+        appearance_sizer.Add(self.repo_view_tabs_cb, 0, wx.LEFT | wx.BOTTOM, 10)
+
         main_sizer.Add(appearance_sizer, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.BOTTOM, 10)
 
         # Updates section
@@ -279,6 +313,8 @@ class OptionsDialog(wx.Dialog):
         self.git_path.SetValue(self.app.prefs.git_path)
         self.git_org_structure_cb.SetValue(self.app.prefs.git_use_org_structure)
         self.git_recursive_cb.SetValue(self.app.prefs.git_clone_recursive)
+        self.git_partial_cb.SetValue(self.app.prefs.git_clone_partial)
+        self.git_jobs_spin.SetValue(self.app.prefs.git_parallel_jobs)
 
         # Notification settings
         self.notify_activity_cb.SetValue(self.app.prefs.notify_activity)
@@ -301,6 +337,8 @@ class OptionsDialog(wx.Dialog):
         else:
             self.dark_mode_choice.SetSelection(0)
 
+        self.repo_view_tabs_cb.SetValue(self.app.prefs.repo_view_tabs)
+
         # Updates setting
         self.check_for_updates_cb.SetValue(self.app.prefs.check_for_updates)
 
@@ -311,6 +349,8 @@ class OptionsDialog(wx.Dialog):
         self.app.prefs.git_path = self.git_path.GetValue()
         self.app.prefs.git_use_org_structure = self.git_org_structure_cb.GetValue()
         self.app.prefs.git_clone_recursive = self.git_recursive_cb.GetValue()
+        self.app.prefs.git_clone_partial = self.git_partial_cb.GetValue()
+        self.app.prefs.git_parallel_jobs = self.git_jobs_spin.GetValue()
 
         # Save notification settings
         self.app.prefs.notify_activity = self.notify_activity_cb.GetValue()
@@ -368,6 +408,8 @@ class OptionsDialog(wx.Dialog):
         new_dark_mode = dark_mode_values[dark_mode_selection]
         self.app.prefs.dark_mode = new_dark_mode
 
+        self.app.prefs.repo_view_tabs = self.repo_view_tabs_cb.GetValue()
+
         # Apply theme if dark mode changed
         if old_dark_mode != new_dark_mode:
             from GUI import main
@@ -431,7 +431,9 @@ class ViewPullRequestDialog(wx.Dialog):
         self.comments_list.Append("Loading comments...")
 
         def do_load():
-            comments = self.account.get_pr_comments(self.owner, self.repo_name, self.pr.number)
+            comments = self.account.get_pr_comments(
+                self.owner, self.repo_name, self.pr.number, include_reviews=True
+            )
             wx.CallAfter(self.update_comments, comments)
 
         threading.Thread(target=do_load, daemon=True).start()
@@ -447,14 +449,19 @@ class ViewPullRequestDialog(wx.Dialog):
             for comment in comments:
                 time_str = comment.created_at.strftime("%Y-%m-%d %H:%M") if comment.created_at else "Unknown"
                 preview = comment.body[:50].replace("\n", " ") + "..." if len(comment.body) > 50 else comment.body.replace("\n", " ")
-                self.comments_list.Append(f"{comment.user.login} ({time_str}): {preview}")
+                # Review comments belong to a line of the diff; say which
+                location = f" Review [{comment.format_location()}]" if comment.is_review_comment else ""
+                self.comments_list.Append(f"{comment.user.login} ({time_str}){location}: {preview}")
 
     def on_comment_select(self, event):
         """Show selected comment content."""
         selection = self.comments_list.GetSelection()
         if selection != wx.NOT_FOUND and selection < len(self.comments):
             comment = self.comments[selection]
-            self.comment_text.SetValue(comment.body)
+            if comment.is_review_comment:
+                self.comment_text.SetValue(f"Review comment on {comment.format_location()}\n\n{comment.body}")
+            else:
+                self.comment_text.SetValue(comment.body)
 
     def on_add_comment(self, event):
         """Add a new comment."""
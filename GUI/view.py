@@ -1,21 +1,140 @@
 """Repository view dialog for FastGH."""
 
 import wx
+import wx.adv
 import webbrowser
 import platform
 import threading
+import time
+from collections import deque
 import subprocess
+import shutil
 import os
 import re
+import codecs
+import importlib
+from concurrent.futures import ThreadPoolExecutor
 from application import get_app
 from models.repository import Repository
 from . import theme
 
 text_box_size = (700, 150)
 
+_IS_WIN = platform.system() == "Windows"
+_IS_MAC = platform.system() == "Darwin"
+
+# Line separator for multi-line text controls
+_DETAILS_SEP = "\n" if _IS_MAC else "\r\n"
+
+# Minimum seconds between progress flushes to the UI during clone/pull (~30 Hz)
+_PROGRESS_INTERVAL = 1 / 30
+
+# Percentage in a git progress line, e.g. "Receiving objects:  45% (450/1000)"
+_PERCENT_RE = re.compile(r"(\d{1,3})%")
+
+# Lines of git output kept in the progress dialog. When the limit is hit, the
+# oldest lines are trimmed down to _OUTPUT_KEEP_LINES in one go.
+_OUTPUT_MAX_LINES = 500
+_OUTPUT_KEEP_LINES = 400
+# Lines of git output kept for the result message (errors, pull summary)
+_RESULT_TAIL_LINES = 200
+
+# Max bytes pulled from git's output pipe per read
+_READ_SIZE = 65536
+
+# Make git fail instead of waiting on a terminal credential prompt nobody can see
+_GIT_ENV = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+
+# Keep git from flashing a console window on Windows
+_CREATIONFLAGS = subprocess.CREATE_NO_WINDOW if _IS_WIN else 0
+
+# Shared workers for short background tasks (status checks, path probes, imports).
+# Clone/pull keep their own daemon thread: they can run for minutes and must not
+# hold up interpreter exit, which joins pool workers.
+_BG_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="fastgh-bg")
+
+
+def _when_all(futures, callback):
+    """Call callback(results) once every future has succeeded, without blocking.
+
+    Nothing is called if any of them raised. Waiting on _BG_POOL work from
+    inside a _BG_POOL task could deadlock the pool, hence the callbacks.
+    """
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def on_done(_):
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        if not any(f.exception() for f in futures):
+            callback([f.result() for f in futures])
+
+    for future in futures:
+        future.add_done_callback(on_done)
+
+
+# Sub-dialogs opened from the view buttons, as (module, class name).
+# These are imported by name, so each module must be in build.py's HIDDEN_IMPORTS.
+_SUB_DIALOGS = {
+    "files": ("GUI.files", "FileBrowserDialog"),
+    "issues": ("GUI.issues", "IssuesDialog"),
+    "prs": ("GUI.pullrequests", "PullRequestsDialog"),
+    "commits": ("GUI.commits", "CommitsDialog"),
+    "actions": ("GUI.actions", "ActionsDialog"),
+    "releases": ("GUI.releases", "ReleasesDialog"),
+    "forks": ("GUI.forks", "ForksDialog"),
+    "owner": ("GUI.search", "UserProfileDialog"),
+}
+
+# Resolved sub-dialog classes, keyed like _SUB_DIALOGS
+_DIALOG_CLASSES = {}
+
+# Set once the sub-dialog modules have been imported in the background
+_PREWARMED = False
+
+
+def _get_dialog_cls(name):
+    """Get a sub-dialog class by key, importing its module on first use."""
+    cls = _DIALOG_CLASSES.get(name)
+    if cls is None:
+        module_name, class_name = _SUB_DIALOGS[name]
+        cls = getattr(importlib.import_module(module_name), class_name)
+        _DIALOG_CLASSES[name] = cls
+    return cls
+
+
+def _split_output(text):
+    """Split git output on \\r and \\n.
+
+    Returns (complete lines, each ending in \\n; leftover partial line).
+    """
+    held = ""
+    if text.endswith("\r"):
+        # May be the first half of a \r\n split across reads
+        text, held = text[:-1], "\r"
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    end = text.rfind("\n") + 1
+    return text[:end], text[end:] + held
+
+
+def _prewarm_imports():
+    """Import the sub-dialog modules so the first click on a view button is instant."""
+    global _PREWARMED
+    if _PREWARMED:
+        return
+    _PREWARMED = True
+    for name in _SUB_DIALOGS:
+        try:
+            _get_dialog_cls(name)
+        except Exception:
+            # Handlers import on demand anyway
+            pass
+
 
 class GitProgressDialog(wx.Dialog):
-    """Dialog for showing git operation progress."""
+    """Modeless dialog for showing git operation progress."""
 
     def __init__(self, parent, title, operation):
         wx.Dialog.__init__(self, parent, title=title, size=(500, 200),
@@ -24,6 +143,15 @@ class GitProgressDialog(wx.Dialog):
         self.process = None
         self.cancelled = False
 
+        # Output queued by the git thread, flushed to the UI in batches
+        self._pending = deque()
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._last_flush = 0.0
+
+        # Lines currently shown in output_text
+        self._output_tail = deque()
+
         self.init_ui()
         theme.apply_theme(self)
 
@@ -36,7 +164,7 @@ class GitProgressDialog(wx.Dialog):
         self.status_label = wx.StaticText(panel, label=f"Starting {self.operation}...")
         sizer.Add(self.status_label, 0, wx.ALL | wx.EXPAND, 10)
 
-        # Progress gauge (indeterminate)
+        # Progress gauge: follows git's per-phase percentage, pulsed otherwise
         self.gauge = wx.Gauge(panel, range=100, style=wx.GA_HORIZONTAL)
         self.gauge.Pulse()
         sizer.Add(self.gauge, 0, wx.LEFT | wx.RIGHT | wx.EXPAND, 10)
@@ -58,162 +186,234 @@ class GitProgressDialog(wx.Dialog):
 
         panel.SetSizer(sizer)
 
-        # Timer for pulsing gauge
-        self.timer = wx.Timer(self)
-        self.Bind(wx.EVT_TIMER, self.on_timer, self.timer)
-        self.timer.Start(50)
-
-    def on_timer(self, event):
-        """Pulse the gauge."""
-        if not self.cancelled:
-            self.gauge.Pulse()
+        # Closing the window cancels; finish() destroys it once git has stopped
+        self.Bind(wx.EVT_CLOSE, self.on_cancel)
 
-    def on_cancel(self, event):
-        """Cancel the operation."""
+    def cancel(self):
+        """Stop the git process. The worker thread then reports completion."""
         self.cancelled = True
         if self.process:
             try:
                 self.process.terminate()
             except:
                 pass
-        self.EndModal(wx.ID_CANCEL)
+
+    def on_cancel(self, event):
+        """Cancel the operation."""
+        self.cancel()
+        self.update_status(f"Cancelling {self.operation}...")
 
     def update_status(self, text):
         """Update status label."""
         self.status_label.SetLabel(text)
 
     def append_output(self, text):
-        """Append text to output."""
-        self.output_text.AppendText(text)
+        """Append text to output, keeping only the most recent lines."""
+        tail = self._output_tail
+        tail.extend(text.splitlines(keepends=True))
+        if len(tail) <= _OUTPUT_MAX_LINES:
+            self.output_text.AppendText(text)
+            return
+        while len(tail) > _OUTPUT_KEEP_LINES:
+            tail.popleft()
+        self.output_text.ChangeValue("".join(tail))
+        self.output_text.SetInsertionPointEnd()
+
+    def update_progress(self, line):
+        """Show a git progress line's percentage on the gauge, or pulse if it has none."""
+        if self.cancelled:
+            return
+        match = _PERCENT_RE.search(line)
+        if match:
+            self.gauge.SetValue(min(int(match.group(1)), 100))
+        else:
+            self.gauge.Pulse()
+
+    def queue_output(self, text):
+        """Queue output from the git thread for the next batched UI flush."""
+        with self._pending_lock:
+            self._pending.append(text)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        wx.CallAfter(self._schedule_flush)
+
+    def _schedule_flush(self):
+        """Flush now, or later if the last flush was too recent."""
+        delay = self._last_flush + _PROGRESS_INTERVAL - time.monotonic()
+        if delay > 0:
+            wx.CallLater(int(delay * 1000) + 1, self._flush_output)
+        else:
+            self._flush_output()
+
+    def _flush_output(self):
+        """Append all queued output at once and show the latest line as the status."""
+        with self._pending_lock:
+            lines = list(self._pending)
+            self._pending.clear()
+            self._flush_scheduled = False
+        self._last_flush = time.monotonic()
+        if not lines:
+            return
+        try:
+            text = "".join(lines)
+            self.append_output(text)
+            status = text.rstrip().rsplit("\n", 1)[-1].strip()
+            self.update_progress(status)
+            if status:
+                self.update_status(status[:60])
+        except RuntimeError:
+            pass  # Dialog was destroyed
 
     def finish(self, success, message=""):
         """Finish the dialog."""
-        self.timer.Stop()
+        self._flush_output()
         if success:
             self.gauge.SetValue(100)
-        self.EndModal(wx.ID_OK if success else wx.ID_CANCEL)
+        self.Destroy()
 
 
 class ViewRepoDialog(wx.Dialog):
     """Dialog for viewing repository details."""
 
+    # (attribute, label, handler, row) for each action button, in tab order.
+    # The git button shows Clone or Pull based on whether the repo exists locally.
+    BUTTONS = [
+        ("star_btn", "&Star", "on_toggle_star", 1),
+        ("watch_btn", "&Watch", "on_toggle_watch", 1),
+        ("open_btn", "&Open in Browser", "on_open", 1),
+        ("copy_url_btn", "Copy &URL", "on_copy_url", 1),
+        ("copy_clone_btn", "Copy &Clone URL", "on_copy_clone", 1),
+        ("git_btn", "&Git...", "on_git", 1),
+        ("files_btn", "View &Files", "on_view_files", 2),
+        ("issues_btn", "View &Issues", "on_view_issues", 2),
+        ("prs_btn", "View &Pull Requests", "on_view_prs", 2),
+        ("commits_btn", "View Co&mmits", "on_view_commits", 2),
+        ("actions_btn", "View &Actions", "on_view_actions", 2),
+        ("releases_btn", "View &Releases", "on_view_releases", 2),
+        ("forks_btn", "View F&orks", "on_view_forks", 2),
+        ("owner_btn", "View O&wner", "on_view_owner", 2),
+    ]
+
     def __init__(self, parent, repo: Repository):
         self.repo = repo
         self.app = get_app()
         self.account = self.app.currentAccount
         self.is_starred = False
         self.is_watched = False
+        self._clone_url = repo.clone_url
+        self._web_url = repo.html_url
+        self._repo_path = self._build_repo_path()
+        self._exists_cache = None
+        self._alive = threading.Event()
+        self._status_pending = True
+        self._status_loaded = False
+        self._git_progress = None
+        # The notification is hidden if it's garbage collected while showing
+        self._notification = None
 
         title = f"View Repository: {repo.full_name}"
         wx.Dialog.__init__(self, parent, title=title, size=(800, 550))
 
-        self.init_ui()
-        self.bind_events()
-        theme.apply_theme(self)
+        # Suppress intermediate paints while building and theming the controls
+        self.Freeze()
+        try:
+            self.init_ui()
+            self.bind_events()
+            theme.apply_theme(self)
+        finally:
+            self.Thaw()
 
-        # Check star/watch status in background
-        self.check_status()
+        # Star/watch status is checked once the dialog is first activated
+        self.update_git_button()
+
+        # Import sub-dialogs once this dialog has had a chance to paint
+        if not _PREWARMED:
+            wx.CallLater(50, self._prewarm_dialogs)
 
     def init_ui(self):
         """Initialize UI."""
+        r = self.repo
         self.panel = wx.Panel(self)
         self.main_box = wx.BoxSizer(wx.VERTICAL)
 
+        # Optionally show the details and file browser as notebook tabs.
+        # The Files tab is only built the first time it is selected.
+        self.notebook = None
+        self.files_page = None
+        if self.app.prefs.repo_view_tabs:
+            self.notebook = wx.Notebook(self.panel)
+            page = wx.Panel(self.notebook)
+            page_box = wx.BoxSizer(wx.VERTICAL)
+            self.files_page = wx.Panel(self.notebook)
+            self.files_page.SetSizer(wx.BoxSizer(wx.VERTICAL))
+            self.notebook.AddPage(page, "Overview")
+            self.notebook.AddPage(self.files_page, "Files")
+            self.main_box.Add(self.notebook, 1, wx.EXPAND | wx.ALL, 5)
+        else:
+            page = self.panel
+            page_box = self.main_box
+
         # Description
-        self.desc_label = wx.StaticText(self.panel, -1, "&Description")
-        self.main_box.Add(self.desc_label, 0, wx.LEFT | wx.TOP, 10)
+        self.desc_label = wx.StaticText(page, -1, "&Description")
+        page_box.Add(self.desc_label, 0, wx.LEFT | wx.TOP, 10)
         self.desc_text = wx.TextCtrl(
-            self.panel,
+            page,
             style=wx.TE_READONLY | wx.TE_MULTILINE,
             size=text_box_size,
             name="Description"
         )
-        self.main_box.Add(self.desc_text, 0, wx.EXPAND | wx.ALL, 10)
-        self.desc_text.SetValue(self.repo.description or "No description")
+        page_box.Add(self.desc_text, 0, wx.EXPAND | wx.ALL, 10)
+        # ChangeValue sets the text without emitting wxEVT_TEXT (SetValue does)
+        self.desc_text.ChangeValue(r.description or "No description")
         self.desc_text.SetFocus()
 
         # Details
-        self.details_label = wx.StaticText(self.panel, -1, "Repository &Details")
-        self.main_box.Add(self.details_label, 0, wx.LEFT | wx.TOP, 10)
+        self.details_label = wx.StaticText(page, -1, "Repository &Details")
+        page_box.Add(self.details_label, 0, wx.LEFT | wx.TOP, 10)
         self.details_text = wx.TextCtrl(
-            self.panel,
+            page,
             style=wx.TE_READONLY | wx.TE_MULTILINE | wx.TE_DONTWRAP,
             size=text_box_size,
             name="Repository Details"
         )
-        self.main_box.Add(self.details_text, 0, wx.EXPAND | wx.ALL, 10)
+        page_box.Add(self.details_text, 0, wx.EXPAND | wx.ALL, 10)
+        if page is not self.panel:
+            page.SetSizer(page_box)
 
         # Build details
-        details = []
-        details.append(f"Name: {self.repo.full_name}")
-        details.append(f"Owner: {self.repo.owner}")
-        details.append(f"Language: {self.repo.language or 'Not specified'}")
-        details.append(f"Stars: {self.repo.stars}")
-        details.append(f"Forks: {self.repo.forks}")
-        details.append(f"Open Issues: {self.repo.open_issues}")
-        details.append(f"Visibility: {'Private' if self.repo.private else 'Public'}")
-        if self.repo.pushed_at:
-            details.append(f"Last Push: {self.repo._format_relative_time()} ({self.repo.pushed_at.strftime('%Y-%m-%d %H:%M')})")
-        details.append(f"URL: {self.repo.html_url}")
-
-        separator = "\r\n" if platform.system() != "Darwin" else "\n"
-        self.details_text.SetValue(separator.join(details))
-
-        # Buttons - first row (star/watch)
-        btn_row1 = wx.BoxSizer(wx.HORIZONTAL)
-
-        self.star_btn = wx.Button(self.panel, -1, "&Star")
-        btn_row1.Add(self.star_btn, 0, wx.RIGHT, 5)
-
-        self.watch_btn = wx.Button(self.panel, -1, "&Watch")
-        btn_row1.Add(self.watch_btn, 0, wx.RIGHT, 5)
-
-        self.open_btn = wx.Button(self.panel, -1, "&Open in Browser")
-        btn_row1.Add(self.open_btn, 0, wx.RIGHT, 5)
-
-        self.copy_url_btn = wx.Button(self.panel, -1, "Copy &URL")
-        btn_row1.Add(self.copy_url_btn, 0, wx.RIGHT, 5)
-
-        self.copy_clone_btn = wx.Button(self.panel, -1, "Copy &Clone URL")
-        btn_row1.Add(self.copy_clone_btn, 0, wx.RIGHT, 5)
-
-        # Git button - will show Clone or Pull based on whether repo exists
-        self.git_btn = wx.Button(self.panel, -1, "&Git...")
-        btn_row1.Add(self.git_btn, 0)
-
-        self.main_box.Add(btn_row1, 0, wx.ALL | wx.ALIGN_CENTER, 5)
-
-        # Buttons - second row
-        btn_row2 = wx.BoxSizer(wx.HORIZONTAL)
-
-        self.files_btn = wx.Button(self.panel, -1, "View &Files")
-        btn_row2.Add(self.files_btn, 0, wx.RIGHT, 5)
-
-        self.issues_btn = wx.Button(self.panel, -1, "View &Issues")
-        btn_row2.Add(self.issues_btn, 0, wx.RIGHT, 5)
-
-        self.prs_btn = wx.Button(self.panel, -1, "View &Pull Requests")
-        btn_row2.Add(self.prs_btn, 0, wx.RIGHT, 5)
-
-        self.commits_btn = wx.Button(self.panel, -1, "View Co&mmits")
-        btn_row2.Add(self.commits_btn, 0, wx.RIGHT, 5)
-
-        self.actions_btn = wx.Button(self.panel, -1, "View &Actions")
-        btn_row2.Add(self.actions_btn, 0, wx.RIGHT, 5)
-
-        self.releases_btn = wx.Button(self.panel, -1, "View &Releases")
-        btn_row2.Add(self.releases_btn, 0, wx.RIGHT, 5)
-
-        self.forks_btn = wx.Button(self.panel, -1, "View F&orks")
-        btn_row2.Add(self.forks_btn, 0, wx.RIGHT, 5)
+        last_push = ""
+        pushed_at = r.pushed_at
+        if pushed_at:
+            relative = r._format_relative_time()
+            stamp = pushed_at.strftime('%Y-%m-%d %H:%M')
+            last_push = f"Last Push: {relative} ({stamp}){_DETAILS_SEP}"
+        details = (
+            f"Name: {r.full_name}{_DETAILS_SEP}"
+            f"Owner: {r.owner}{_DETAILS_SEP}"
+            f"Language: {r.language or 'Not specified'}{_DETAILS_SEP}"
+            f"Stars: {r.stars}{_DETAILS_SEP}"
+            f"Forks: {r.forks}{_DETAILS_SEP}"
+            f"Open Issues: {r.open_issues}{_DETAILS_SEP}"
+            f"Visibility: {'Private' if r.private else 'Public'}{_DETAILS_SEP}"
+            f"{last_push}"
+            f"URL: {self._web_url}"
+        )
+        self.details_text.ChangeValue(details)
 
-        self.owner_btn = wx.Button(self.panel, -1, "View O&wner")
-        btn_row2.Add(self.owner_btn, 0, wx.RIGHT, 5)
+        # Buttons, one wrapping row per group
+        rows = {1: wx.WrapSizer(wx.HORIZONTAL), 2: wx.WrapSizer(wx.HORIZONTAL)}
+        for attr, label, handler, row in self.BUTTONS:
+            btn = wx.Button(self.panel, -1, label)
+            setattr(self, attr, btn)
+            rows[row].Add(btn, 0, wx.RIGHT | wx.BOTTOM, 5)
+            btn.Bind(wx.EVT_BUTTON, getattr(self, handler))
 
         self.close_btn = wx.Button(self.panel, wx.ID_CANCEL, "Cl&ose")
-        btn_row2.Add(self.close_btn, 0)
+        rows[2].Add(self.close_btn, 0, wx.BOTTOM, 5)
 
-        self.main_box.Add(btn_row2, 0, wx.ALL | wx.ALIGN_CENTER, 5)
+        self.main_box.Add(rows[1], 0, wx.ALL | wx.EXPAND, 5)
+        self.main_box.Add(rows[2], 0, wx.ALL | wx.EXPAND, 5)
 
         self.panel.SetSizer(self.main_box)
         self.panel.Layout()
@@ -222,21 +422,13 @@ class ViewRepoDialog(wx.Dialog):
         """Bind event handlers."""
         self.Bind(wx.EVT_CLOSE, self.on_close)
         self.Bind(wx.EVT_CHAR_HOOK, self.on_char_hook)
-        self.star_btn.Bind(wx.EVT_BUTTON, self.on_toggle_star)
-        self.watch_btn.Bind(wx.EVT_BUTTON, self.on_toggle_watch)
-        self.open_btn.Bind(wx.EVT_BUTTON, self.on_open)
-        self.copy_url_btn.Bind(wx.EVT_BUTTON, self.on_copy_url)
-        self.copy_clone_btn.Bind(wx.EVT_BUTTON, self.on_copy_clone)
-        self.git_btn.Bind(wx.EVT_BUTTON, self.on_git)
-        self.files_btn.Bind(wx.EVT_BUTTON, self.on_view_files)
-        self.issues_btn.Bind(wx.EVT_BUTTON, self.on_view_issues)
-        self.prs_btn.Bind(wx.EVT_BUTTON, self.on_view_prs)
-        self.commits_btn.Bind(wx.EVT_BUTTON, self.on_view_commits)
-        self.actions_btn.Bind(wx.EVT_BUTTON, self.on_view_actions)
-        self.releases_btn.Bind(wx.EVT_BUTTON, self.on_view_releases)
-        self.forks_btn.Bind(wx.EVT_BUTTON, self.on_view_forks)
-        self.owner_btn.Bind(wx.EVT_BUTTON, self.on_view_owner)
-        self.close_btn.Bind(wx.EVT_BUTTON, self.on_close)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.on_destroy)
+        self.Bind(wx.EVT_ACTIVATE, self.on_activate)
+        if self.notebook:
+            self.notebook.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.on_page_changed)
+        # close_btn uses wx.ID_CANCEL, so the default handler ends the modal loop
+        # once on_close_button lets the event through
+        self.close_btn.Bind(wx.EVT_BUTTON, self.on_close_button)
 
     def on_char_hook(self, event):
         """Handle key events."""
@@ -245,37 +437,81 @@ class ViewRepoDialog(wx.Dialog):
         else:
             event.Skip()
 
+    def on_activate(self, event):
+        """Run the status check while the dialog is active; abort it when deactivated."""
+        if event.GetActive():
+            self._alive.set()
+            if self._status_pending:
+                self._status_pending = False
+                self.check_status()
+        else:
+            self._alive.clear()
+            # Retry on the next activation if the check was aborted
+            if not self._status_loaded:
+                self._status_pending = True
+        event.Skip()
+
     def check_status(self):
         """Check star/watch status in background."""
-        def do_check():
-            is_starred = self.account.is_starred(self.repo.owner, self.repo.name)
-            is_watched = self.account.is_watching(self.repo.owner, self.repo.name)
-            wx.CallAfter(self.update_status, is_starred, is_watched)
+        alive = self._alive
 
-        threading.Thread(target=do_check, daemon=True).start()
+        owner, name = self.repo.owner, self.repo.name
 
-        # Check git status
-        self.update_git_button()
+        def show(status):
+            if alive.is_set():
+                wx.CallAfter(self.update_status, *status)
 
-    def get_repo_path(self):
-        """Get the local path for this repository."""
+        def do_check():
+            status = self.account.get_repo_user_status(owner, name)
+            if status is not None:
+                show(status)
+            elif alive.is_set():
+                # Fall back to the REST endpoints, run concurrently on the shared pool
+                _when_all([
+                    _BG_POOL.submit(self.account.is_starred, owner, name),
+                    _BG_POOL.submit(self.account.is_watching, owner, name)
+                ], show)
+
+        _BG_POOL.submit(do_check)
+
+    def _build_repo_path(self):
+        """Build the local path for this repository from the git prefs."""
         git_path = self.app.prefs.git_path
         if self.app.prefs.git_use_org_structure:
             return os.path.join(git_path, self.repo.owner, self.repo.name)
         return os.path.join(git_path, self.repo.name)
 
+    def get_repo_path(self):
+        """Get the local path for this repository."""
+        return self._repo_path
+
     def repo_exists_locally(self):
-        """Check if the repository exists locally."""
-        repo_path = self.get_repo_path()
-        return os.path.isdir(os.path.join(repo_path, ".git"))
+        """Check if the repository exists locally (cached until the next clone/pull)."""
+        if self._exists_cache is None:
+            self._exists_cache = os.path.isdir(os.path.join(self._repo_path, ".git"))
+        return self._exists_cache
+
+    @staticmethod
+    def _set_label(button, label):
+        """Set a button label, skipping the repaint if it is unchanged."""
+        if button.GetLabel() != label:
+            button.SetLabel(label)
 
     def update_git_button(self):
-        """Update git button label based on whether repo exists."""
+        """Update git button label based on whether repo exists.
+
+        The existence check runs in the background since git_path may be on a slow mount.
+        """
+        def do_check():
+            exists = self.repo_exists_locally()
+            wx.CallAfter(self._set_git_label, exists)
+
+        _BG_POOL.submit(do_check)
+
+    def _set_git_label(self, exists):
+        """Show Pull or Clone on the git button."""
         try:
-            if self.repo_exists_locally():
-                self.git_btn.SetLabel("&Pull")
-            else:
-                self.git_btn.SetLabel("C&lone")
+            self._set_label(self.git_btn, "&Pull" if exists else "C&lone")
         except RuntimeError:
             pass  # Dialog was destroyed
 
@@ -283,76 +519,99 @@ class ViewRepoDialog(wx.Dialog):
         """Update button labels based on status."""
         self.is_starred = is_starred
         self.is_watched = is_watched
+        self._status_loaded = True
+        self._status_pending = False
 
         # Check if dialog/buttons still exist (may be destroyed if closed quickly)
         try:
-            if is_starred:
-                self.star_btn.SetLabel("Un&star")
-            else:
-                self.star_btn.SetLabel("&Star")
-
-            if is_watched:
-                self.watch_btn.SetLabel("Un&watch")
-            else:
-                self.watch_btn.SetLabel("&Watch")
+            self._set_label(self.star_btn, "Un&star" if is_starred else "&Star")
+            self._set_label(self.watch_btn, "Un&watch" if is_watched else "&Watch")
         except RuntimeError:
             pass  # Dialog was destroyed
 
     def on_toggle_star(self, event):
         """Star or unstar the repository."""
+        owner, name = self.repo.owner, self.repo.name
         if self.is_starred:
-            if self.account.unstar_repo(self.repo.owner, self.repo.name):
+            if self.account.unstar_repo(owner, name):
                 self.is_starred = False
                 self.star_btn.SetLabel("&Star")
-                wx.MessageBox(f"Unstarred {self.repo.full_name}", "Success", wx.OK | wx.ICON_INFORMATION)
+                self._toast("Unstarred", f"Unstarred {self.repo.full_name}")
             else:
                 wx.MessageBox("Failed to unstar repository.", "Error", wx.OK | wx.ICON_ERROR)
         else:
-            if self.account.star_repo(self.repo.owner, self.repo.name):
+            if self.account.star_repo(owner, name):
                 self.is_starred = True
                 self.star_btn.SetLabel("Un&star")
-                wx.MessageBox(f"Starred {self.repo.full_name}", "Success", wx.OK | wx.ICON_INFORMATION)
+                self._toast("Starred", f"Starred {self.repo.full_name}")
             else:
                 wx.MessageBox("Failed to star repository.", "Error", wx.OK | wx.ICON_ERROR)
 
     def on_toggle_watch(self, event):
         """Watch or unwatch the repository."""
+        owner, name = self.repo.owner, self.repo.name
         if self.is_watched:
-            if self.account.unwatch_repo(self.repo.owner, self.repo.name):
+            if self.account.unwatch_repo(owner, name):
                 self.is_watched = False
                 self.watch_btn.SetLabel("&Watch")
-                wx.MessageBox(f"Unwatched {self.repo.full_name}", "Success", wx.OK | wx.ICON_INFORMATION)
+                self._toast("Unwatched", f"Unwatched {self.repo.full_name}")
             else:
                 wx.MessageBox("Failed to unwatch repository.", "Error", wx.OK | wx.ICON_ERROR)
         else:
-            if self.account.watch_repo(self.repo.owner, self.repo.name):
+            if self.account.watch_repo(owner, name):
                 self.is_watched = True
                 self.watch_btn.SetLabel("Un&watch")
-                wx.MessageBox(f"Now watching {self.repo.full_name}", "Success", wx.OK | wx.ICON_INFORMATION)
+                self._toast("Watching", f"Now watching {self.repo.full_name}")
             else:
                 wx.MessageBox("Failed to watch repository.", "Error", wx.OK | wx.ICON_ERROR)
 
     def on_open(self, event):
         """Open repository in browser."""
-        webbrowser.open(self.repo.html_url)
+        webbrowser.open(self._web_url)
+
+    def _toast(self, title, message):
+        """Show a non-blocking desktop notification, or a message box if that fails."""
+        try:
+            self._notification = wx.adv.NotificationMessage(title, message, self)
+            self._notification.SetFlags(wx.ICON_INFORMATION)
+            if self._notification.Show(timeout=3):
+                return
+        except (AttributeError, RuntimeError, NotImplementedError):
+            pass  # Notifications not supported on this platform
+        self._notification = None
+        wx.MessageBox(message, title, wx.OK | wx.ICON_INFORMATION)
+
+    @staticmethod
+    def _copy_to_clipboard(text):
+        """Copy text to the clipboard. Returns True on success."""
+        if not wx.TheClipboard.Open():
+            return False
+        try:
+            return wx.TheClipboard.SetData(wx.TextDataObject(text))
+        finally:
+            wx.TheClipboard.Close()
+
+    def _copy(self, text):
+        """Copy text and confirm with a notification, or report the failure."""
+        if self._copy_to_clipboard(text):
+            self._toast("Copied", text)
+        else:
+            wx.MessageBox("Could not access the clipboard.", "Error", wx.OK | wx.ICON_ERROR)
 
     def on_copy_url(self, event):
         """Copy repository URL to clipboard."""
-        if wx.TheClipboard.Open():
-            wx.TheClipboard.SetData(wx.TextDataObject(self.repo.html_url))
-            wx.TheClipboard.Close()
-            wx.MessageBox(f"Copied: {self.repo.html_url}", "Copied", wx.OK | wx.ICON_INFORMATION)
+        self._copy(self._web_url)
 
     def on_copy_clone(self, event):
         """Copy git clone URL to clipboard."""
-        clone_url = f"https://github.com/{self.repo.full_name}.git"
-        if wx.TheClipboard.Open():
-            wx.TheClipboard.SetData(wx.TextDataObject(clone_url))
-            wx.TheClipboard.Close()
-            wx.MessageBox(f"Copied: {clone_url}", "Copied", wx.OK | wx.ICON_INFORMATION)
+        self._copy(self._clone_url)
 
     def on_git(self, event):
         """Clone or pull the repository."""
+        if self._git_progress is not None:
+            self._git_progress.Raise()
+            return
+
         git_path = self.app.prefs.git_path
 
         # Ensure git path exists
@@ -375,9 +634,9 @@ class ViewRepoDialog(wx.Dialog):
     def do_git_clone(self):
         """Clone the repository."""
         git_path = self.app.prefs.git_path
-        clone_url = f"https://github.com/{self.repo.full_name}.git"
         use_org_structure = self.app.prefs.git_use_org_structure
         use_recursive = self.app.prefs.git_clone_recursive
+        use_partial = self.app.prefs.git_clone_partial
 
         # If using org structure, create owner directory and clone into it
         if use_org_structure:
@@ -397,103 +656,122 @@ class ViewRepoDialog(wx.Dialog):
         # Create progress dialog
         progress_dlg = GitProgressDialog(self, f"Cloning {self.repo.name}", "clone")
 
-        cmd = ["git", "clone", "--progress"]
+        jobs = self.app.prefs.git_parallel_jobs
+        cmd = ["git", "-c", f"submodule.fetchJobs={jobs}", "clone", "--progress"]
         if use_recursive:
-            cmd.append("--recursive")
-        cmd.append(clone_url)
+            cmd.extend(["--recursive", f"--jobs={jobs}"])
+        if use_partial:
+            # Full history, but blobs are only fetched when checked out
+            cmd.append("--filter=blob:none")
+        cmd.append(self._clone_url)
 
         self._run_git_with_progress(progress_dlg, cmd, clone_dir, "clone")
 
     def do_git_pull(self):
         """Pull the latest changes."""
-        repo_path = self.get_repo_path()
+        repo_path = self._repo_path
 
         # Create progress dialog
         progress_dlg = GitProgressDialog(self, f"Pulling {self.repo.name}", "pull")
 
-        cmd = ["git", "pull", "--progress"]
+        jobs = self.app.prefs.git_parallel_jobs
+        cmd = ["git", "-c", f"submodule.fetchJobs={jobs}", "pull", "--progress", f"--jobs={jobs}"]
 
         self._run_git_with_progress(progress_dlg, cmd, repo_path, "pull")
 
     def _run_git_with_progress(self, progress_dlg, cmd, cwd, operation):
-        """Run a git command with progress dialog."""
-        success = [False]
-        error_message = [""]
-        final_output = [""]
+        """Run a git command in the background with a modeless progress dialog."""
+        # A cancelled clone leaves a partial checkout that would pass for a repo.
+        # Only remove it if the clone created the folder; an existing folder of
+        # the same name (e.g. a worktree whose .git is a file) is left alone.
+        partial_dir = None
+        if operation == "clone" and not os.path.exists(self._repo_path):
+            partial_dir = self._repo_path
 
         def run_git():
+            success = False
+            error_message = ""
+            output_tail = deque(maxlen=_RESULT_TAIL_LINES)
             try:
-                creationflags = subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
                 process = subprocess.Popen(
                     cmd,
                     cwd=cwd,
+                    stdin=subprocess.DEVNULL,
                     stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    creationflags=creationflags
+                    stderr=subprocess.STDOUT,
+                    env=_GIT_ENV,
+                    creationflags=_CREATIONFLAGS
                 )
                 progress_dlg.process = process
 
-                # Read stderr (where git outputs progress) in real-time
-                output_lines = []
+                # Stream output (git writes progress to stderr, merged into stdout).
+                # read1() returns whatever is buffered in one call, so progress
+                # updates separated by \r arrive in batches rather than line by line.
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                tail = ""
                 while True:
                     if progress_dlg.cancelled:
                         process.terminate()
                         break
 
-                    line = process.stderr.readline()
-                    if not line and process.poll() is not None:
+                    chunk = process.stdout.read1(_READ_SIZE)
+                    if not chunk:
                         break
-                    if line:
-                        output_lines.append(line)
-                        # Update dialog on main thread
-                        wx.CallAfter(progress_dlg.append_output, line)
-                        # Update status with progress info
-                        line_stripped = line.strip()
-                        if line_stripped:
-                            wx.CallAfter(progress_dlg.update_status, line_stripped[:60])
-
-                # Also get stdout
-                stdout, remaining_stderr = process.communicate()
-                if stdout:
-                    output_lines.append(stdout)
-                    wx.CallAfter(progress_dlg.append_output, stdout)
-                if remaining_stderr:
-                    output_lines.append(remaining_stderr)
-                    wx.CallAfter(progress_dlg.append_output, remaining_stderr)
-
-                final_output[0] = "".join(output_lines)
-                success[0] = process.returncode == 0 and not progress_dlg.cancelled
-
-                if not success[0] and not progress_dlg.cancelled:
-                    error_message[0] = final_output[0]
+                    text, tail = _split_output(tail + decoder.decode(chunk))
+                    if text:
+                        output_tail.extend(text.splitlines(True))
+                        progress_dlg.queue_output(text)
+
+                tail += decoder.decode(b"", final=True)
+                if tail.strip():
+                    output_tail.append(tail)
+                    progress_dlg.queue_output(tail)
+
+                process.wait()
+
+                success = process.returncode == 0 and not progress_dlg.cancelled
+
+                if not success and not progress_dlg.cancelled:
+                    error_message = "".join(output_tail)
+                if progress_dlg.cancelled and partial_dir:
+                    shutil.rmtree(partial_dir, ignore_errors=True)
 
             except FileNotFoundError:
-                error_message[0] = "Git is not installed or not in PATH."
+                error_message = "Git is not installed or not in PATH."
             except Exception as e:
-                error_message[0] = str(e)
+                error_message = str(e)
+
+            wx.CallAfter(self._on_git_complete, progress_dlg, operation, success, output_tail, error_message)
 
-            # Close dialog on main thread
-            wx.CallAfter(progress_dlg.finish, success[0])
+        # Only one clone/pull at a time; the rest of the dialog stays usable
+        self._git_progress = progress_dlg
+        self.git_btn.Disable()
 
-        # Start git operation in background
         threading.Thread(target=run_git, daemon=True).start()
+        progress_dlg.Show()
 
-        # Show dialog modally
-        result = progress_dlg.ShowModal()
-        progress_dlg.Destroy()
+    def _on_git_complete(self, progress_dlg, operation, success, output_tail, error_message):
+        """Close the progress dialog and report the result of a clone/pull."""
+        cancelled = progress_dlg.cancelled
+        if progress_dlg:
+            progress_dlg.finish(success)
+        if not self:
+            return  # Dialog was closed while git was running
 
         # Update button state
+        self._git_progress = None
+        self.git_btn.Enable()
+        self._exists_cache = None
         self.update_git_button()
 
         # Show result message
-        if progress_dlg.cancelled:
+        if cancelled:
             wx.MessageBox(
                 f"{operation.capitalize()} was cancelled.",
                 f"{operation.capitalize()} Cancelled",
                 wx.OK | wx.ICON_INFORMATION
             )
-        elif success[0]:
+        elif success:
             if operation == "clone":
                 wx.MessageBox(
                     f"Successfully cloned {self.repo.full_name} to:\n{self.get_repo_path()}",
@@ -501,7 +779,7 @@ class ViewRepoDialog(wx.Dialog):
                     wx.OK | wx.ICON_INFORMATION
                 )
             else:
-                message = final_output[0].strip() if final_output[0] else "Already up to date."
+                message = "".join(output_tail).strip() or "Already up to date."
                 wx.MessageBox(
                     f"Pull complete:\n\n{message}",
                     "Pull Complete",
@@ -509,66 +787,106 @@ class ViewRepoDialog(wx.Dialog):
                 )
         else:
             wx.MessageBox(
-                f"Failed to {operation}:\n\n{error_message[0]}",
+                f"Failed to {operation}:\n\n{error_message}",
                 f"{operation.capitalize()} Failed",
                 wx.OK | wx.ICON_ERROR
             )
 
-    def on_view_files(self, event):
-        """Open file browser dialog."""
-        from GUI.files import FileBrowserDialog
-        dlg = FileBrowserDialog(self, self.repo)
+    def on_page_changed(self, event):
+        """Build the Files tab the first time it is shown."""
+        event.Skip()
+        if self.notebook.GetPage(event.GetSelection()) is not self.files_page:
+            return
+        if self.files_page.GetChildren():
+            return
+        from GUI.files import FileBrowserPanel
+        browser = FileBrowserPanel(self.files_page, self.repo)
+        self.files_page.GetSizer().Add(browser, 1, wx.EXPAND)
+        theme.apply_theme(browser)
+        self.files_page.Layout()
+
+    def _prewarm_dialogs(self):
+        """Import the sub-dialog modules in the background."""
+        if not _PREWARMED:
+            _BG_POOL.submit(_prewarm_imports)
+
+    def _show_dialog(self, name, *args):
+        """Show a sub-dialog modally."""
+        dlg = _get_dialog_cls(name)(self, *args)
         dlg.ShowModal()
         dlg.Destroy()
 
+    def on_view_files(self, event):
+        """Show the Files tab, or open the file browser dialog."""
+        if self.notebook:
+            self.notebook.SetSelection(self.notebook.FindPage(self.files_page))
+            return
+        self._show_dialog("files", self.repo)
+
     def on_view_issues(self, event):
         """Open issues dialog."""
-        from GUI.issues import IssuesDialog
-        dlg = IssuesDialog(self, self.repo)
-        dlg.ShowModal()
-        dlg.Destroy()
+        self._show_dialog("issues", self.repo)
 
     def on_view_prs(self, event):
         """Open pull requests dialog."""
-        from GUI.pullrequests import PullRequestsDialog
-        dlg = PullRequestsDialog(self, self.repo)
-        dlg.ShowModal()
-        dlg.Destroy()
+        self._show_dialog("prs", self.repo)
 
     def on_view_commits(self, event):
         """Open commits dialog."""
-        from GUI.commits import CommitsDialog
-        dlg = CommitsDialog(self, self.repo)
-        dlg.ShowModal()
-        dlg.Destroy()
+        self._show_dialog("commits", self.repo)
 
     def on_view_actions(self, event):
         """Open actions dialog."""
-        from GUI.actions import ActionsDialog
-        dlg = ActionsDialog(self, self.repo)
-        dlg.ShowModal()
-        dlg.Destroy()
+        self._show_dialog("actions", self.repo)
 
     def on_view_releases(self, event):
         """Open releases dialog."""
-        from GUI.releases import ReleasesDialog
-        dlg = ReleasesDialog(self, self.repo)
-        dlg.ShowModal()
-        dlg.Destroy()
+        self._show_dialog("releases", self.repo)
 
     def on_view_forks(self, event):
         """Open forks dialog."""
-        from GUI.forks import ForksDialog
-        dlg = ForksDialog(self, self.repo)
-        dlg.ShowModal()
-        dlg.Destroy()
+        self._show_dialog("forks", self.repo)
 
     def on_view_owner(self, event):
         """View owner profile."""
-        from GUI.search import UserProfileDialog
-        dlg = UserProfileDialog(self, self.repo.owner)
-        dlg.ShowModal()
-        dlg.Destroy()
+        self._show_dialog("owner", self.repo.owner)
+
+    def on_destroy(self, event):
+        """Stop background work once the dialog is destroyed."""
+        if event.GetEventObject() is self:
+            self._alive.clear()
+            # Don't leave git running in the background
+            if self._git_progress is not None:
+                self._git_progress.cancel()
+        event.Skip()
+
+    def _confirm_stop_git(self):
+        """Before closing, ask whether to cancel a running clone/pull. Returns True to close."""
+        if self._git_progress is None:
+            return True
+        operation = self._git_progress.operation
+        result = wx.MessageBox(
+            f"A {operation} of {self.repo.full_name} is still running.\n\n"
+            f"Cancel the {operation} and close?",
+            "Git Operation Running",
+            wx.YES_NO | wx.NO_DEFAULT | wx.ICON_QUESTION,
+            self
+        )
+        if result != wx.YES:
+            self._git_progress.Raise()
+            return False
+        self._git_progress.cancel()
+        return True
+
+    def on_close_button(self, event):
+        """Let the Close button end the dialog once a running clone/pull is dealt with."""
+        if self._confirm_stop_git():
+            event.Skip()
 
     def on_close(self, event):
+        if not self._confirm_stop_git():
+            if event is not None and event.CanVeto():
+                event.Veto()
+            return
+        self._alive.clear()
         self.Destroy()
@@ -4,14 +4,18 @@ import sys
 import platform
 import os
 import re
-import json
+import subprocess
 import threading
+import time
 import webbrowser
 import tempfile
 import shutil
+from functools import cache
+from concurrent.futures import Future, ThreadPoolExecutor
 import config
 import wx
 import requests
+import github_api
 from version import APP_NAME, APP_SHORTNAME, APP_VERSION, APP_AUTHOR
 
 shortname = APP_SHORTNAME
@@ -19,12 +23,84 @@ name = APP_NAME
 version = APP_VERSION
 author = APP_AUTHOR
 
+# The platform doesn't change at runtime; look it up once
+_IS_WIN = platform.system() == "Windows"
+_IS_MAC = platform.system() == "Darwin"
+
+# Release body markers written by the CI build
+_COMMIT_RE = re.compile(r'Automated build from commit\s+([a-f0-9]+)')
+_VERSION_RE = re.compile(r'\*\*Version:\*\*\s*(\d+\.\d+\.\d+)')
+
+# Download buffer size and minimum seconds between progress callbacks
+_DOWNLOAD_CHUNK = 1024 * 1024
+_PROGRESS_INTERVAL = 0.05
+
+# Minimum seconds between automatic update checks
+_UPDATE_CHECK_INTERVAL = 24 * 60 * 60
+
+# Sentinel for "not looked up yet", since None is a valid cached result
+_MISSING = object()
+
+# Release asset to download for this platform, chosen once at import
+if _IS_WIN:
+    def _is_platform_asset(name):
+        return 'windows' in name and name.endswith('.zip')
+elif _IS_MAC:
+    def _is_platform_asset(name):
+        return name.endswith('.dmg')
+else:
+    def _is_platform_asset(name):
+        return False
+
+
+def _remove_file(path):
+    """Delete a file, ignoring it if it doesn't exist."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _call_on_ui(fn, *args):
+    """Run fn on the UI thread from a background thread and return its result."""
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+
+    wx.CallAfter(run)
+    return future.result()
+
+
+class _ProgressWriter:
+    """File wrapper that reports bytes written, at most every _PROGRESS_INTERVAL."""
+
+    def __init__(self, f, total, callback):
+        self.f = f
+        self.total = total
+        self.callback = callback
+        self.written = 0
+        self._last_report = 0.0
+
+    def write(self, data):
+        self.f.write(data)
+        self.written += len(data)
+        now = time.monotonic()
+        if now - self._last_report >= _PROGRESS_INTERVAL:
+            self._last_report = now
+            self.callback(self.written, self.total)
+
+    def finish(self):
+        """Report the final size."""
+        self.callback(self.written, self.total)
+
 
 class Application:
     """Main application class that holds all global state and utility methods."""
 
-    _instance = None
-
     def __init__(self):
         self.accounts = []
         self.prefs = None
@@ -32,35 +108,31 @@ class Application:
         self.errors = []
         self.currentAccount = None
         self._initialized = False
-
-    @classmethod
-    def get_instance(cls):
-        """Get the singleton application instance."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        self._build_commit = _MISSING
 
     def load(self):
         """Initialize the application - load preferences and accounts."""
         if self._initialized:
             return
 
+        # GUI.main imports this module, so it can't be imported at the top
         from GUI import main
-        import github_api
 
-        self.prefs = config.Config(name="FastGH", autosave=True)
+        # Autosave is enabled after the defaults below are filled in, so
+        # startup writes the config file once instead of once per key
+        self.prefs = config.Config(name="FastGH", autosave=False)
         # In portable mode, userdata folder is already app-specific, don't add /FastGH
         if config.is_portable_mode():
             self.confpath = self.prefs._user_config_home
         else:
-            self.confpath = self.prefs._user_config_home + "/FastGH"
+            self.confpath = os.path.join(self.prefs._user_config_home, "FastGH")
 
         # Redirect stderr to log file on Windows
-        if platform.system() != "Darwin":
+        if not _IS_MAC:
             try:
                 f = open(os.path.join(self.confpath, "errors.log"), "a")
                 sys.stderr = f
-            except:
+            except OSError:
                 pass
 
         # Load preferences with defaults
@@ -78,7 +150,6 @@ class Application:
         self.prefs.commit_limit = self.prefs.get("commit_limit", 0)
 
         # Download location (default to user's Downloads folder)
-        import os
         default_downloads = os.path.join(os.path.expanduser("~"), "Downloads")
         self.prefs.download_location = self.prefs.get("download_location", default_downloads)
 
@@ -92,6 +163,11 @@ class Application:
         # Git clone options
         self.prefs.git_use_org_structure = self.prefs.get("git_use_org_structure", False)
         self.prefs.git_clone_recursive = self.prefs.get("git_clone_recursive", False)
+        self.prefs.git_clone_partial = self.prefs.get("git_clone_partial", True)
+        self.prefs.git_parallel_jobs = self.prefs.get("git_parallel_jobs", min(8, os.cpu_count() or 4))
+
+        # Show the file browser as a tab in the repository view instead of a dialog
+        self.prefs.repo_view_tabs = self.prefs.get("repo_view_tabs", False)
 
         # OS notification settings
         self.prefs.notify_activity = self.prefs.get("notify_activity", False)
@@ -104,6 +180,10 @@ class Application:
 
         # Check for updates on startup
         self.prefs.check_for_updates = self.prefs.get("check_for_updates", True)
+        self.prefs.last_update_check = self.prefs.get("last_update_check", 0)
+
+        self.prefs.save()
+        self.prefs.set_autosave(True)
 
         # Load accounts
         if self.prefs.accounts > 0:
@@ -112,18 +192,12 @@ class Application:
 
             # Load remaining accounts
             if self.prefs.accounts > 1:
-                for i in range(1, self.prefs.accounts):
-                    if self._is_account_configured(i):
-                        self.add_session(i)
-                    else:
-                        self.add_session(i)
+                self._load_accounts_parallel(range(1, self.prefs.accounts))
 
         self._initialized = True
 
     def add_session(self, index=None):
         """Add a new GitHub account session."""
-        import github_api
-        import wx
         if index is None:
             index = len(self.accounts)
         try:
@@ -137,41 +211,47 @@ class Application:
                 wx.CallAfter(wx.Exit)
                 return
 
-    def _is_account_configured(self, index):
-        """Check if an account has credentials saved."""
-        try:
-            if config.is_portable_mode():
-                prefs = config.Config(name="account" + str(index), autosave=False, save_on_exit=False)
-            else:
-                prefs = config.Config(name="FastGH/account" + str(index), autosave=False, save_on_exit=False)
-            return bool(prefs.get("access_token", ""))
-        except:
-            return False
+    def _load_accounts_parallel(self, indexes):
+        """Load saved accounts concurrently, keeping their order.
+
+        Accounts that need the user (no token, or it was rejected) are redone
+        on the main thread, where add_session can show the auth dialogs.
+        """
+        with ThreadPoolExecutor(max_workers=min(8, len(indexes))) as executor:
+            futures = [
+                executor.submit(github_api.GitHubAccount, self, i, interactive=False)
+                for i in indexes
+            ]
+        for i, future in zip(indexes, futures):
+            try:
+                account = future.result()
+            except github_api.AccountNeedsAuth:
+                self.add_session(i)
+                continue
+            account.interactive = True
+            self.accounts.append(account)
 
     def remove_account(self, index):
         """Remove an account by index."""
-        import shutil
         if index < 0 or index >= len(self.accounts):
             return False
 
         # Remove from accounts list
         removed = self.accounts.pop(index)
 
-        # Delete config folder
-        if config.is_portable_mode():
-            config_path = os.path.join(self.confpath, f"account{index}")
-        else:
-            config_path = os.path.join(self.confpath, f"account{index}")
+        # Config folders for this account and every one after it
+        paths = [os.path.join(self.confpath, f"account{j}") for j in range(index, self.prefs.accounts)]
 
-        if os.path.exists(config_path):
-            shutil.rmtree(config_path)
+        # Delete config folder
+        shutil.rmtree(paths[0], ignore_errors=True)
 
         # Shift remaining account folders down
-        for j in range(index + 1, self.prefs.accounts):
-            old_path = os.path.join(self.confpath, f"account{j}")
-            new_path = os.path.join(self.confpath, f"account{j-1}")
-            if os.path.exists(old_path):
-                shutil.move(old_path, new_path)
+        for k in range(1, len(paths)):
+            try:
+                # Same directory, so a plain rename is enough
+                os.replace(paths[k], paths[k - 1])
+            except FileNotFoundError:
+                pass
 
         self.prefs.accounts -= 1
 
@@ -206,33 +286,28 @@ class Application:
 
     def openURL(self, url):
         """Open a URL in the default browser."""
-        if platform.system() != "Darwin":
+        if not _IS_MAC:
             webbrowser.open(url)
         else:
-            os.system(f"open {url}")
+            # Pass the URL as an argument rather than through a shell
+            subprocess.Popen(["/usr/bin/open", url])
 
     def question_from_thread(self, title, text):
         """Show a question dialog from a background thread. Returns 1 for Yes, 2 for No."""
-        result = [None]
-        event = threading.Event()
-        def show_dialog():
-            result[0] = self.question(title, text)
-            event.set()
-        wx.CallAfter(show_dialog)
-        event.wait()
-        return result[0]
+        return _call_on_ui(self.question, title, text)
 
     def alert_from_thread(self, message, caption=""):
         """Show an alert dialog from a background thread."""
-        event = threading.Event()
-        def show_dialog():
-            self.alert(message, caption)
-            event.set()
-        wx.CallAfter(show_dialog)
-        event.wait()
+        _call_on_ui(self.alert, message, caption)
 
     def _get_local_build_commit(self):
-        """Get the commit SHA from the build_info.txt file."""
+        """Get the commit SHA from the build_info.txt file (read once, None if missing)."""
+        if self._build_commit is _MISSING:
+            self._build_commit = self._read_build_commit()
+        return self._build_commit
+
+    def _read_build_commit(self):
+        """Read the commit SHA from the first build_info.txt found."""
         possible_paths = []
 
         if getattr(sys, 'frozen', False):
@@ -245,12 +320,11 @@ class Application:
             possible_paths.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'build_info.txt'))
 
         for path in possible_paths:
-            if os.path.exists(path):
-                try:
-                    with open(path, 'r') as f:
-                        return f.read().strip()
-                except:
-                    pass
+            try:
+                with open(path, 'r') as f:
+                    return f.read().strip()
+            except OSError:
+                pass
         return None
 
     def download_file_to(self, url, dest_path, progress_callback=None):
@@ -258,15 +332,14 @@ class Application:
         with requests.get(url, stream=True, timeout=30) as r:
             r.raise_for_status()
             total_size = int(r.headers.get('content-length', 0))
-            downloaded = 0
-            chunk_size = 1024 * 1024  # 1MB chunks
+            r.raw.decode_content = True
             with open(dest_path, 'wb') as f:
-                for chunk in r.iter_content(chunk_size=chunk_size):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if progress_callback:
-                            progress_callback(downloaded, total_size)
+                if progress_callback:
+                    writer = _ProgressWriter(f, total_size, progress_callback)
+                    shutil.copyfileobj(r.raw, writer, _DOWNLOAD_CHUNK)
+                    writer.finish()
+                else:
+                    shutil.copyfileobj(r.raw, f, _DOWNLOAD_CHUNK)
 
     def cfu(self, silent=True):
         """Check for updates."""
@@ -276,12 +349,20 @@ class Application:
                 self.alert("Auto-updater is only available in compiled builds.\n\nWhen running from source, use git pull to update.", "Update Check")
             return
 
+        # Automatic checks run at most once a day; manual checks always run
+        if silent and time.time() - self.prefs.last_update_check < _UPDATE_CHECK_INTERVAL:
+            return
+
         try:
             # Get releases from GitHub
-            releases = json.loads(requests.get(
+            with requests.get(
                 "https://api.github.com/repos/masonasons/FastGH/releases",
-                headers={"accept": "application/vnd.github.v3+json"}
-            ).content.decode())
+                headers={"accept": "application/vnd.github.v3+json"},
+                timeout=10
+            ) as resp:
+                resp.raise_for_status()
+                releases = resp.json()
+            self.prefs.last_update_check = time.time()
 
             if not releases:
                 if not silent:
@@ -293,11 +374,11 @@ class Application:
             body = latest.get('body', '')
 
             # Parse commit SHA from release body
-            commit_match = re.search(r'Automated build from commit\s+([a-f0-9]+)', body)
+            commit_match = _COMMIT_RE.search(body)
             release_commit = commit_match.group(1) if commit_match else None
 
             # Parse version from release body
-            version_match = re.search(r'\*\*Version:\*\*\s*(\d+\.\d+\.\d+)', body)
+            version_match = _VERSION_RE.search(body)
             latest_version = version_match.group(1) if version_match else latest.get('tag_name', 'unknown')
 
             # Get local build commit
@@ -316,7 +397,7 @@ class Application:
                     current_ver = parse_version(version)
                     latest_ver = parse_version(latest_version)
                     update_available = latest_ver > current_ver
-                except:
+                except (ValueError, AttributeError):
                     pass
 
             if update_available:
@@ -332,11 +413,7 @@ class Application:
                 ud = self.question_from_thread("Update available: " + latest_version, message)
                 if ud == 1:
                     for asset in latest['assets']:
-                        asset_name = asset['name'].lower()
-                        if platform.system() == "Windows" and 'windows' in asset_name and asset_name.endswith('.zip'):
-                            threading.Thread(target=self.download_update, args=[asset['browser_download_url']], daemon=True).start()
-                            return
-                        elif platform.system() == "Darwin" and asset_name.endswith('.dmg'):
+                        if _is_platform_asset(asset['name'].lower()):
                             threading.Thread(target=self.download_update, args=[asset['browser_download_url']], daemon=True).start()
                             return
                     self.alert_from_thread("A download for this version could not be found for your platform.", "Error")
@@ -350,11 +427,60 @@ class Application:
             if not silent:
                 self.alert_from_thread(f"Error checking for updates: {e}", "Update Check Error")
 
+    def _run_download_with_progress(self, url, dest_path):
+        """Download a file from a background thread while showing a progress dialog.
+
+        Returns False if the user cancelled (the partial file is removed).
+        Download errors are raised after the dialog is closed.
+        """
+        progress_data = {'dialog': None, 'cancelled': False}
+
+        def create_progress_dialog():
+            progress_data['dialog'] = wx.ProgressDialog(
+                "Downloading Update",
+                "Downloading FastGH update...",
+                maximum=100,
+                style=wx.PD_APP_MODAL | wx.PD_AUTO_HIDE | wx.PD_CAN_ABORT | wx.PD_ELAPSED_TIME | wx.PD_REMAINING_TIME
+            )
+            progress_data['dialog'].Raise()
+
+        def update_progress(downloaded, total):
+            if progress_data['dialog'] and total > 0:
+                percent = int((downloaded / total) * 100)
+                mb_downloaded = downloaded / (1024 * 1024)
+                mb_total = total / (1024 * 1024)
+                def do_update():
+                    if progress_data['dialog']:
+                        cont, _ = progress_data['dialog'].Update(
+                            percent,
+                            f"Downloading: {mb_downloaded:.1f} MB / {mb_total:.1f} MB"
+                        )
+                        if not cont:
+                            progress_data['cancelled'] = True
+                wx.CallAfter(do_update)
+
+        def close_progress_dialog():
+            if progress_data['dialog']:
+                progress_data['dialog'].Destroy()
+                progress_data['dialog'] = None
+
+        _call_on_ui(create_progress_dialog)
+
+        try:
+            self.download_file_to(url, dest_path, progress_callback=update_progress)
+        finally:
+            wx.CallAfter(close_progress_dialog)
+
+        if progress_data['cancelled']:
+            _remove_file(dest_path)
+            return False
+        return True
+
     def download_update(self, url):
         """Download and install an update."""
         temp_dir = tempfile.gettempdir()
 
-        if platform.system() == "Windows":
+        if _IS_WIN:
             if getattr(sys, 'frozen', False):
                 app_dir = os.path.dirname(sys.executable)
             else:
@@ -364,64 +490,16 @@ class Application:
             final_zip_path = os.path.join(app_dir, "FastGH-update.zip")
             extract_dir = os.path.join(app_dir, "FastGH-update")
 
-            progress_data = {'dialog': None, 'cancelled': False}
-
-            def create_progress_dialog():
-                progress_data['dialog'] = wx.ProgressDialog(
-                    "Downloading Update",
-                    "Downloading FastGH update...",
-                    maximum=100,
-                    style=wx.PD_APP_MODAL | wx.PD_AUTO_HIDE | wx.PD_CAN_ABORT | wx.PD_ELAPSED_TIME | wx.PD_REMAINING_TIME
-                )
-                progress_data['dialog'].Raise()
-
-            def update_progress(downloaded, total):
-                if progress_data['dialog'] and total > 0:
-                    percent = int((downloaded / total) * 100)
-                    mb_downloaded = downloaded / (1024 * 1024)
-                    mb_total = total / (1024 * 1024)
-                    def do_update():
-                        if progress_data['dialog']:
-                            cont, _ = progress_data['dialog'].Update(
-                                percent,
-                                f"Downloading: {mb_downloaded:.1f} MB / {mb_total:.1f} MB"
-                            )
-                            if not cont:
-                                progress_data['cancelled'] = True
-                    wx.CallAfter(do_update)
-
-            def close_progress_dialog():
-                if progress_data['dialog']:
-                    progress_data['dialog'].Destroy()
-                    progress_data['dialog'] = None
-
-            event = threading.Event()
-            def create_and_signal():
-                create_progress_dialog()
-                event.set()
-            wx.CallAfter(create_and_signal)
-            event.wait()
-
             try:
                 # Remove old update files
-                if os.path.exists(zip_path):
-                    os.remove(zip_path)
-                if os.path.exists(final_zip_path):
-                    os.remove(final_zip_path)
-                if os.path.exists(extract_dir):
-                    shutil.rmtree(extract_dir)
+                _remove_file(zip_path)
+                _remove_file(final_zip_path)
+                shutil.rmtree(extract_dir, ignore_errors=True)
 
                 # Download the zip file
-                self.download_file_to(url, zip_path, progress_callback=update_progress)
-
-                if progress_data['cancelled']:
-                    wx.CallAfter(close_progress_dialog)
-                    if os.path.exists(zip_path):
-                        os.remove(zip_path)
+                if not self._run_download_with_progress(url, zip_path):
                     return
 
-                wx.CallAfter(close_progress_dialog)
-
                 # Move from temp to app directory
                 shutil.move(zip_path, final_zip_path)
 
@@ -458,71 +536,26 @@ del "%~f0"
                 wx.CallAfter(wx.Exit)
 
             except Exception as e:
-                wx.CallAfter(close_progress_dialog)
                 self.alert_from_thread(f"Failed to download or apply update: {e}", "Update Error")
 
         else:
             # macOS
-            progress_data = {'dialog': None, 'cancelled': False}
-
-            def create_progress_dialog():
-                progress_data['dialog'] = wx.ProgressDialog(
-                    "Downloading Update",
-                    "Downloading FastGH update...",
-                    maximum=100,
-                    style=wx.PD_APP_MODAL | wx.PD_AUTO_HIDE | wx.PD_CAN_ABORT | wx.PD_ELAPSED_TIME | wx.PD_REMAINING_TIME
-                )
-                progress_data['dialog'].Raise()
-
-            def update_progress(downloaded, total):
-                if progress_data['dialog'] and total > 0:
-                    percent = int((downloaded / total) * 100)
-                    mb_downloaded = downloaded / (1024 * 1024)
-                    mb_total = total / (1024 * 1024)
-                    def do_update():
-                        if progress_data['dialog']:
-                            cont, _ = progress_data['dialog'].Update(
-                                percent,
-                                f"Downloading: {mb_downloaded:.1f} MB / {mb_total:.1f} MB"
-                            )
-                            if not cont:
-                                progress_data['cancelled'] = True
-                    wx.CallAfter(do_update)
-
-            def close_progress_dialog():
-                if progress_data['dialog']:
-                    progress_data['dialog'].Destroy()
-                    progress_data['dialog'] = None
-
-            event = threading.Event()
-            def create_and_signal():
-                create_progress_dialog()
-                event.set()
-            wx.CallAfter(create_and_signal)
-            event.wait()
-
             try:
                 local_filename = url.split('/')[-1]
                 local_filename = os.path.expanduser("~/Downloads/" + local_filename)
-                self.download_file_to(url, local_filename, progress_callback=update_progress)
-
-                if progress_data['cancelled']:
-                    wx.CallAfter(close_progress_dialog)
-                    if os.path.exists(local_filename):
-                        os.remove(local_filename)
+                if not self._run_download_with_progress(url, local_filename):
                     return
 
-                wx.CallAfter(close_progress_dialog)
                 self.alert_from_thread(
                     f"FastGH has been downloaded to:\n{local_filename}\n\n"
                     "Please open the DMG file and drag FastGH to your Applications folder to complete the update.",
                     "Update Downloaded"
                 )
             except Exception as e:
-                wx.CallAfter(close_progress_dialog)
                 self.alert_from_thread(f"Failed to download update: {e}", "Download Error")
 
 
-# Convenience function to get the app instance
+# Convenience function to get the app instance (created on first call)
+@cache
 def get_app():
-    return Application.get_instance()
+    return Application()
@@ -1,12 +1,20 @@
 #!/usr/bin/env python
 """Build script for FastGH using PyInstaller - supports Windows and macOS."""
 
+import argparse
+import functools
+import mmap
 import os
 import subprocess
 import sys
 import shutil
 import tempfile
+import time
+import zipfile
+import zlib
 import platform as platform_mod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 from version import APP_NAME, APP_VERSION
@@ -15,6 +23,85 @@ APP_DESCRIPTION = "A GitHub desktop client"
 APP_COPYRIGHT = "Copyright 2024"
 APP_VENDOR = "FastGH"
 
+# Environment variables CI systems use for the commit being built
+COMMIT_SHA_ENV_VARS = ("GITHUB_SHA", "CI_COMMIT_SHA", "BUILD_SOURCEVERSION")
+
+# Keep captured-output helper processes from opening console windows on Windows
+NO_WINDOW = {"creationflags": subprocess.CREATE_NO_WINDOW} if sys.platform == "win32" else {}
+
+# pefile releases after this make PyInstaller's binary scan on Windows
+# dramatically slower (pyinstaller/pyinstaller#8762)
+FAST_PEFILE_VERSION = "2023.2.7"
+
+# Output buffer size when writing the Windows zip
+ZIP_WRITE_BUFFER = 4 * 1024 * 1024
+
+# DEFLATE level for each --compress mode. LZMA isn't offered: the updater
+# extracts with PowerShell's Expand-Archive, which only supports DEFLATE.
+COMPRESS_LEVELS = {
+    "fast": 1,
+    "balanced": 6,
+    "small": 9,
+}
+
+# Files that are already compressed and are stored in the zip as-is
+STORED_SUFFIXES = (
+    ".pyz", ".zip", ".gz", ".bz2", ".xz", ".7z", ".whl",
+    ".png", ".jpg", ".jpeg", ".gif",
+)
+
+
+# Hidden imports that PyInstaller might miss
+HIDDEN_IMPORTS = (
+    # wx submodules
+    "wx.adv",
+    "wx.html",
+    "wx.xml",
+    # Our packages
+    "models",
+    "models.repository",
+    "models.issue",
+    "models.commit",
+    "models.user",
+    "models.workflow",
+    "models.release",
+    "models.notification",
+    "models.event",
+    "GUI",
+    "GUI.main",
+    "GUI.view",
+    "GUI.options",
+    "GUI.accounts",
+    "GUI.issues",
+    "GUI.pullrequests",
+    "GUI.commits",
+    "GUI.actions",
+    "GUI.releases",
+    "GUI.search",
+    "GUI.files",
+    "GUI.forks",
+    "GUI.theme",
+    # Other modules
+    "config",
+    "application",
+    "github_api",
+    "version",
+    # keyboard_handler
+    "keyboard_handler",
+    "keyboard_handler.wx_handler",
+    # requests/urllib
+    "requests",
+    "urllib3",
+    "certifi",
+    "charset_normalizer",
+    "idna",
+    # Other
+    "json",
+    "threading",
+    "datetime",
+    "webbrowser",
+)
+
 
 def get_platform():
     """Get the current platform."""
@@ -26,12 +113,47 @@ def get_platform():
         return "linux"
 
 
+@functools.lru_cache(maxsize=1)
 def get_git_commit_sha():
-    """Get the current git commit SHA."""
+    """Get the current git commit SHA (looked up once per run).
+
+    Prefers the SHA provided by CI, then reads .git directly, and only runs
+    git if neither works.
+    """
+    for var in COMMIT_SHA_ENV_VARS:
+        sha = os.environ.get(var)
+        if sha:
+            return sha
+    return read_git_head(Path(__file__).parent.resolve()) or git_rev_parse()
+
+
+def read_git_head(repo_dir: Path):
+    """Resolve HEAD by reading the .git directory, or None if that isn't possible."""
+    git_dir = repo_dir / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return head  # Detached HEAD
+        ref = head[5:]
+        try:
+            return (git_dir / ref).read_text().strip()
+        except FileNotFoundError:
+            # Ref has been packed
+            with open(git_dir / "packed-refs") as f:
+                for line in f:
+                    if line.rstrip().endswith(" " + ref):
+                        return line.split(" ", 1)[0]
+    except OSError:
+        pass  # Not a plain .git directory (e.g. a worktree or submodule)
+    return None
+
+
+def git_rev_parse():
+    """Get the HEAD commit SHA by running git."""
     try:
         result = subprocess.run(
             ["git", "rev-parse", "HEAD"],
-            capture_output=True, text=True
+            capture_output=True, text=True, **NO_WINDOW
         )
         if result.returncode == 0:
             return result.stdout.strip()
@@ -62,53 +184,7 @@ def cleanup_build_info_file(script_dir: Path):
 
 def get_hidden_imports():
     """Get list of hidden imports that PyInstaller might miss."""
-    return [
-        # wx submodules
-        "wx.adv",
-        "wx.html",
-        "wx.xml",
-        # Our packages
-        "models",
-        "models.repository",
-        "models.issue",
-        "models.commit",
-        "models.user",
-        "models.workflow",
-        "models.release",
-        "models.notification",
-        "models.event",
-        "GUI",
-        "GUI.main",
-        "GUI.view",
-        "GUI.options",
-        "GUI.accounts",
-        "GUI.issues",
-        "GUI.pullrequests",
-        "GUI.commits",
-        "GUI.actions",
-        "GUI.releases",
-        "GUI.search",
-        "GUI.theme",
-        # Other modules
-        "config",
-        "application",
-        "github_api",
-        "version",
-        # keyboard_handler
-        "keyboard_handler",
-        "keyboard_handler.wx_handler",
-        # requests/urllib
-        "requests",
-        "urllib3",
-        "certifi",
-        "charset_normalizer",
-        "idna",
-        # Other
-        "json",
-        "threading",
-        "datetime",
-        "webbrowser",
-    ]
+    return HIDDEN_IMPORTS
 
 
 def get_data_files(script_dir: Path):
@@ -121,24 +197,80 @@ def get_data_files(script_dir: Path):
     return datas
 
 
+# Shared library suffixes shipped inside keyboard_handler, per platform
+LIBRARY_SUFFIXES = {
+    "win32": (".dll",),
+    "darwin": (".dylib", ".so"),
+}
+
+
 def get_binaries():
-    """Get platform-specific binaries to include."""
+    """Get platform-specific binaries to include.
+
+    These are passed explicitly so PyInstaller doesn't have to walk
+    keyboard_handler looking for them (see get_collect_args).
+    """
     binaries = []
 
-    if sys.platform == "win32":
-        # Include keyboard_handler DLLs if present
+    suffixes = LIBRARY_SUFFIXES.get(sys.platform)
+    if suffixes:
+        # Include keyboard_handler libraries if present
         try:
             import keyboard_handler
-            kh_path = Path(keyboard_handler.__file__).parent
-            for dll in kh_path.glob("*.dll"):
-                binaries.append((str(dll), "keyboard_handler"))
+            kh_path = os.path.dirname(keyboard_handler.__file__)
+            with os.scandir(kh_path) as it:
+                for entry in it:
+                    if entry.name.lower().endswith(suffixes) and entry.is_file():
+                        binaries.append((entry.path, "keyboard_handler"))
         except ImportError:
             pass
 
     return binaries
 
 
-def build_windows(script_dir: Path, output_dir: Path) -> tuple:
+def get_collect_args():
+    """PyInstaller collection flags for keyboard_handler.
+
+    Equivalent to --collect-all minus its binary search, which get_binaries
+    already covers.
+    """
+    return [
+        "--collect-submodules", "keyboard_handler",
+        "--collect-data", "keyboard_handler",
+    ]
+
+
+def check_and_fix_pefile():
+    """Install the fast pefile release if a slower one is present (Windows only)."""
+    if sys.platform != "win32":
+        return
+
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        installed = version("pefile")
+    except PackageNotFoundError:
+        return
+
+    def parse(v):
+        return tuple(int(x) for x in v.split("."))
+
+    try:
+        slow = parse(installed) > parse(FAST_PEFILE_VERSION)
+    except ValueError:
+        return
+    if not slow:
+        return
+
+    print(f"pefile {installed} slows PyInstaller down; installing pefile {FAST_PEFILE_VERSION}...")
+    result = subprocess.run(
+        [sys.executable, "-m", "pip", "install", f"pefile=={FAST_PEFILE_VERSION}"]
+    )
+    if result.returncode != 0:
+        print("Warning: could not install the faster pefile; continuing with the installed one")
+
+
+def build_windows(script_dir: Path, output_dir: Path, clean: bool = False, compress: str = "balanced") -> tuple:
     """Build for Windows using PyInstaller.
 
     Returns:
@@ -147,14 +279,17 @@ def build_windows(script_dir: Path, output_dir: Path) -> tuple:
     dist_dir = output_dir / "dist"
     build_dir = output_dir / "build"
 
-    # Clean previous build
-    for d in [dist_dir, build_dir]:
+    # Clean previous build. The work directory holds PyInstaller's analysis
+    # cache, so it is kept between builds unless a clean build is requested.
+    for d in [dist_dir, build_dir] if clean else [dist_dir]:
         if d.exists():
             print(f"Cleaning {d}...")
             shutil.rmtree(d)
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    check_and_fix_pefile()
+
     # Create build_info.txt BEFORE building command so get_data_files can include it
     create_build_info_file(script_dir)
 
@@ -170,6 +305,8 @@ def build_windows(script_dir: Path, output_dir: Path) -> tuple:
         f"--workpath={build_dir}",
         f"--specpath={output_dir}",
     ]
+    if clean:
+        cmd.append("--clean")
 
     # Add hidden imports
     for imp in get_hidden_imports():
@@ -184,7 +321,7 @@ def build_windows(script_dir: Path, output_dir: Path) -> tuple:
         cmd.extend(["--add-binary", f"{src}{os.pathsep}{dst}"])
 
     # Collect keyboard_handler
-    cmd.extend(["--collect-all", "keyboard_handler"])
+    cmd.extend(get_collect_args())
 
     # Add main script
     cmd.append(str(main_script))
@@ -209,15 +346,80 @@ def build_windows(script_dir: Path, output_dir: Path) -> tuple:
         return False, None
 
     # Create zip file for distribution
-    zip_path = create_windows_zip(output_dir, app_dir)
+    zip_path = create_windows_zip(output_dir, app_dir, COMPRESS_LEVELS[compress])
 
     return True, zip_path
 
 
-def create_windows_zip(output_dir: Path, app_dir: Path) -> Path:
-    """Create a zip file of the Windows build for distribution."""
-    import zipfile
+def _scan_files(top: str, arc_prefix: str):
+    """Yield (path, stat, arcname) for every file under top, using os.scandir.
+
+    DirEntry caches the file type from the directory listing, so only one
+    stat per file is needed (none extra for directories).
+    """
+    with os.scandir(top) as it:
+        for entry in it:
+            arcname = f"{arc_prefix}/{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_files(entry.path, arcname)
+            elif entry.is_file():
+                yield entry.path, entry.stat(), arcname
+
+
+def _zipinfo_for(arcname: str, st: os.stat_result) -> zipfile.ZipInfo:
+    """Build a ZipInfo from an existing stat result (like ZipInfo.from_file)."""
+    date_time = max(time.localtime(st.st_mtime)[:6], (1980, 1, 1, 0, 0, 0))
+    zinfo = zipfile.ZipInfo(arcname, date_time)
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    return zinfo
+
+
+def _compress_file(path, compress_type, level):
+    """Read one file for the zip and raw-DEFLATE it if requested (runs in a worker process).
 
+    Returns:
+        Tuple of (crc32, uncompressed size, member data)
+    """
+    with open(path, 'rb') as f:
+        if compress_type != zipfile.ZIP_DEFLATED:
+            data = f.read()
+            return zlib.crc32(data), len(data), data
+
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return 0, 0, compressor.flush()  # Empty files can't be mapped
+
+        # Compress straight from the page cache instead of copying the file
+        # into a bytes object first
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = compressor.compress(mm) + compressor.flush()
+            return zlib.crc32(mm), size, data
+
+
+def _write_precompressed(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, data: bytes):
+    """Append an already-compressed member to a zip opened for writing.
+
+    zipfile has no public API for this, so it mirrors what ZipFile.open(..., 'w')
+    does for a seekable file, minus the compression.
+    """
+    zinfo.flag_bits = 0
+    zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+    zinfo.header_offset = zipf.fp.tell()
+    zipf._writecheck(zinfo)
+    zipf._didModify = True
+    zipf.fp.write(zinfo.FileHeader(zip64))
+    zipf.fp.write(data)
+    zipf.start_dir = zipf.fp.tell()
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+
+
+def create_windows_zip(output_dir: Path, app_dir: Path, level: int = COMPRESS_LEVELS["balanced"]) -> Path:
+    """Create a zip file of the Windows build for distribution.
+
+    Uses 7-Zip when it is installed, otherwise zipfile with parallel workers.
+    """
     zip_name = f"{APP_NAME}-{APP_VERSION}-Windows.zip"
     zip_path = output_dir / zip_name
 
@@ -226,11 +428,8 @@ def create_windows_zip(output_dir: Path, app_dir: Path) -> Path:
 
     print(f"Creating zip: {zip_name}...")
 
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for file_path in app_dir.rglob('*'):
-            if file_path.is_file():
-                arc_name = Path(APP_NAME) / file_path.relative_to(app_dir)
-                zipf.write(file_path, arc_name)
+    if not _create_zip_with_7z(zip_path, app_dir, level):
+        _create_zip_in_python(zip_path, app_dir, level)
 
     zip_size_mb = zip_path.stat().st_size / (1024 * 1024)
     print(f"Zip created: {zip_path}")
@@ -239,7 +438,53 @@ def create_windows_zip(output_dir: Path, app_dir: Path) -> Path:
     return zip_path
 
 
-def build_macos(script_dir: Path, output_dir: Path) -> tuple:
+def _create_zip_with_7z(zip_path: Path, app_dir: Path, level: int) -> bool:
+    """Build the zip with 7-Zip's multi-threaded DEFLATE, if 7z is installed.
+
+    Returns False (leaving no partial zip) if 7z is missing or fails.
+    """
+    seven_zip = shutil.which("7z")
+    if not seven_zip:
+        return False
+
+    # Run from the dist folder so entries are stored under APP_NAME/
+    result = subprocess.run(
+        [seven_zip, "a", "-tzip", "-mm=Deflate", f"-mx={level}", "-mmt=on", "-bd",
+         str(zip_path), app_dir.name],
+        cwd=app_dir.parent, capture_output=True, text=True, **NO_WINDOW
+    )
+    if result.returncode != 0:
+        print(f"7z failed, falling back to zipfile: {result.stderr or result.stdout}")
+        zip_path.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def _create_zip_in_python(zip_path: Path, app_dir: Path, level: int):
+    """Build the zip with zipfile, compressing in parallel worker processes."""
+    files = list(_scan_files(str(app_dir), APP_NAME))
+    paths = [f[0] for f in files]
+    # Deflating already-compressed data costs CPU and saves nothing
+    compress_types = [
+        zipfile.ZIP_STORED if path.lower().endswith(STORED_SUFFIXES) else zipfile.ZIP_DEFLATED
+        for path in paths
+    ]
+
+    # A large write buffer turns many small member writes into few syscalls
+    with open(zip_path, 'wb', buffering=ZIP_WRITE_BUFFER) as out, \
+            zipfile.ZipFile(out, 'w') as zipf, \
+            ProcessPoolExecutor() as executor:
+        results = executor.map(_compress_file, paths, compress_types, repeat(level), chunksize=8)
+        for (_, st, arc_name), compress_type, (crc, size, data) in zip(files, compress_types, results):
+            zinfo = _zipinfo_for(arc_name, st)
+            zinfo.compress_type = compress_type
+            zinfo.CRC = crc
+            zinfo.file_size = size
+            zinfo.compress_size = len(data)
+            _write_precompressed(zipf, zinfo, data)
+
+
+def build_macos(script_dir: Path, output_dir: Path, clean: bool = False) -> tuple:
     """Build for macOS using PyInstaller.
 
     Returns:
@@ -250,8 +495,9 @@ def build_macos(script_dir: Path, output_dir: Path) -> tuple:
     dist_dir = output_dir / "dist"
     build_dir = output_dir / "build"
 
-    # Clean previous build
-    for d in [dist_dir, build_dir]:
+    # Clean previous build. The work directory holds PyInstaller's analysis
+    # cache, so it is kept between builds unless a clean build is requested.
+    for d in [dist_dir, build_dir] if clean else [dist_dir]:
         if d.exists():
             print(f"Cleaning {d}...")
             shutil.rmtree(d)
@@ -276,6 +522,8 @@ def build_macos(script_dir: Path, output_dir: Path) -> tuple:
         f"--specpath={output_dir}",
         f"--osx-bundle-identifier={bundle_id}",
     ]
+    if clean:
+        cmd.append("--clean")
 
     # Add hidden imports
     for imp in get_hidden_imports():
@@ -285,8 +533,12 @@ def build_macos(script_dir: Path, output_dir: Path) -> tuple:
     for src, dst in get_data_files(script_dir):
         cmd.extend(["--add-data", f"{src}{os.pathsep}{dst}"])
 
+    # Add binaries
+    for src, dst in get_binaries():
+        cmd.extend(["--add-binary", f"{src}{os.pathsep}{dst}"])
+
     # Collect keyboard_handler
-    cmd.extend(["--collect-all", "keyboard_handler"])
+    cmd.extend(get_collect_args())
 
     # Add main script
     cmd.append(str(main_script))
@@ -310,26 +562,32 @@ def build_macos(script_dir: Path, output_dir: Path) -> tuple:
         print("Error: App bundle not found")
         return False, None
 
-    # Update Info.plist
-    plist_path = app_path / "Contents" / "Info.plist"
-    if plist_path.exists():
-        print("Updating Info.plist...")
-        with open(plist_path, 'rb') as f:
-            plist = plistlib.load(f)
-
-        plist.update({
-            'CFBundleName': APP_NAME,
-            'CFBundleDisplayName': APP_NAME,
-            'CFBundleIdentifier': bundle_id,
-            'CFBundleVersion': APP_VERSION,
-            'CFBundleShortVersionString': APP_VERSION,
-            'NSHumanReadableCopyright': APP_COPYRIGHT,
-            'LSMinimumSystemVersion': '10.13',
-            'NSHighResolutionCapable': True,
-        })
-
-        with open(plist_path, 'wb') as f:
-            plistlib.dump(plist, f)
+    # Clear extended attributes in the background while Info.plist is updated
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        xattr_job = executor.submit(clear_extended_attributes, app_path)
+
+        # Update Info.plist
+        plist_path = app_path / "Contents" / "Info.plist"
+        if plist_path.exists():
+            print("Updating Info.plist...")
+            with open(plist_path, 'rb') as f:
+                plist = plistlib.load(f)
+
+            plist.update({
+                'CFBundleName': APP_NAME,
+                'CFBundleDisplayName': APP_NAME,
+                'CFBundleIdentifier': bundle_id,
+                'CFBundleVersion': APP_VERSION,
+                'CFBundleShortVersionString': APP_VERSION,
+                'NSHumanReadableCopyright': APP_COPYRIGHT,
+                'LSMinimumSystemVersion': '10.13',
+                'NSHighResolutionCapable': True,
+            })
+
+            with open(plist_path, 'wb') as f:
+                plistlib.dump(plist, f)
+
+        xattr_job.result()
 
     # Code sign the app (ad-hoc)
     sign_macos_app(app_path)
@@ -340,12 +598,17 @@ def build_macos(script_dir: Path, output_dir: Path) -> tuple:
     return True, dmg_path
 
 
+def clear_extended_attributes(app_path: Path):
+    """Strip extended attributes (quarantine etc.) that would break signing."""
+    subprocess.run(["xattr", "-cr", str(app_path)], capture_output=True)
+
+
 def sign_macos_app(app_path: Path):
-    """Sign the macOS app bundle with ad-hoc signature."""
-    print("Signing app with ad-hoc signature...")
+    """Sign the macOS app bundle with ad-hoc signature.
 
-    # Clear extended attributes
-    subprocess.run(["xattr", "-cr", str(app_path)], capture_output=True)
+    Extended attributes must already be cleared (see clear_extended_attributes).
+    """
+    print("Signing app with ad-hoc signature...")
 
     # Sign app bundle
     result = subprocess.run(
@@ -359,6 +622,23 @@ def sign_macos_app(app_path: Path):
         print(f"Code signing warning: {result.stderr}")
 
 
+def clone_tree(src: Path, dst: Path):
+    """Copy a directory tree, using APFS clones when possible.
+
+    `cp -c` makes copy-on-write clones, so no file data is duplicated on APFS.
+    On other filesystems `ditto` does the copy, keeping extended attributes
+    and resource forks, with copytree as a last resort.
+    """
+    result = subprocess.run(["cp", "-cR", str(src), str(dst)], capture_output=True)
+    if result.returncode == 0:
+        return
+    shutil.rmtree(dst, ignore_errors=True)
+    result = subprocess.run(["ditto", str(src), str(dst)], capture_output=True)
+    if result.returncode != 0:
+        shutil.rmtree(dst, ignore_errors=True)
+        shutil.copytree(src, dst, symlinks=True)
+
+
 def create_macos_dmg(output_dir: Path, app_path: Path) -> Path:
     """Create a DMG disk image for macOS distribution."""
     dmg_name = f"{APP_NAME}-{APP_VERSION}.dmg"
@@ -369,12 +649,13 @@ def create_macos_dmg(output_dir: Path, app_path: Path) -> Path:
 
     print(f"Creating DMG: {dmg_name}...")
 
-    with tempfile.TemporaryDirectory() as temp_dir:
+    # Stage next to the app so the copy below stays on the same volume
+    with tempfile.TemporaryDirectory(dir=output_dir) as temp_dir:
         temp_path = Path(temp_dir)
 
         # Copy app
         temp_app = temp_path / app_path.name
-        shutil.copytree(app_path, temp_app, symlinks=True)
+        clone_tree(app_path, temp_app)
 
         # Create Applications symlink
         try:
@@ -388,8 +669,8 @@ def create_macos_dmg(output_dir: Path, app_path: Path) -> Path:
             "-volname", APP_NAME,
             "-srcfolder", str(temp_path),
             "-ov",
-            "-format", "UDZO",
-            "-imagekey", "zlib-level=9",
+            # LZFSE: compresses on all cores, unlike UDZO's single-threaded zlib
+            "-format", "ULFO",
             str(dmg_path)
         ], capture_output=True, text=True)
 
@@ -404,8 +685,28 @@ def create_macos_dmg(output_dir: Path, app_path: Path) -> Path:
     return dmg_path
 
 
+def link_or_copy(src: Path, dst: Path):
+    """Hard-link src to dst, copying only if they are on different filesystems."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 def main():
     """Build FastGH executable using PyInstaller."""
+    parser = argparse.ArgumentParser(description=f"Build {APP_NAME} with PyInstaller.")
+    parser.add_argument(
+        "--clean", action="store_true",
+        help="discard PyInstaller's cached work directory and rebuild from scratch"
+    )
+    parser.add_argument(
+        "--compress", choices=COMPRESS_LEVELS, default="balanced",
+        help="Windows zip compression: fast (level 1), balanced (6) or small (9)"
+    )
+    args = parser.parse_args()
+
     script_dir = Path(__file__).parent.resolve()
 
     platform = get_platform()
@@ -418,9 +719,9 @@ def main():
     print()
 
     if platform == "windows":
-        success, artifact_path = build_windows(script_dir, output_dir)
+        success, artifact_path = build_windows(script_dir, output_dir, args.clean, args.compress)
     elif platform == "macos":
-        success, artifact_path = build_macos(script_dir, output_dir)
+        success, artifact_path = build_macos(script_dir, output_dir, args.clean)
     else:
         print(f"Unsupported platform: {platform}")
         sys.exit(1)
@@ -434,7 +735,7 @@ def main():
         if artifact_path and artifact_path.exists():
             dest_path = script_dir / artifact_path.name
             print(f"Copying to source folder: {dest_path}")
-            shutil.copy2(artifact_path, dest_path)
+            link_or_copy(artifact_path, dest_path)
             print(f"Artifact: {dest_path}")
 
         print("=" * 50)
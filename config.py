@@ -180,6 +180,10 @@ class Config(MutableMapping):
         else:
             del self[name]
 
+    def set_autosave(self, enabled):
+        """Turn saving after every change on or off."""
+        self._autosave = enabled
+
     def close(self):
         """Save and close the config."""
         if not self._closed:
@@ -188,3 +192,12 @@ class Config(MutableMapping):
             atexit.unregister(self.save)
             return True
         return False
+
+    def discard(self):
+        """Close the config without saving it."""
+        if not self._closed:
+            self._closed = True
+            self._autosave = False
+            atexit.unregister(self.save)
+            return True
+        return False
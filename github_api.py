@@ -1,9 +1,19 @@
 """GitHub API wrapper with OAuth Device Flow authentication."""
 
+import os
 import time
 import threading
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from math import ceil
+from urllib.parse import parse_qs, urlsplit
 import requests
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import config
 import wx
 from models.repository import Repository
@@ -24,12 +34,231 @@ GITHUB_CLIENT_ID = "Ov23liErbWGLzAKTlLFW"  # Replace with your client ID
 # GitHub API base URL
 GITHUB_API_URL = "https://api.github.com"
 
+# Don't reuse a saved device code with less than this many seconds left
+DEVICE_CODE_MARGIN = 60
+
+# How long (in seconds) cached star/watch status stays valid
+REPO_STATUS_TTL = 60
+
+# (connect, read) timeout for the quick status checks made when a dialog opens
+STATUS_TIMEOUT = (3, 10)
+
+# Concurrent page requests when fetching the rest of a paginated list
+PAGE_WORKERS = 8
+
+# Connections kept per host; parallel refreshes share the session with paging
+POOL_SIZE = PAGE_WORKERS * 2
+
+# Rate-limit and server errors that safe (GET/HEAD) requests are retried on;
+# a Retry-After header on 429/503 is honored instead of the backoff
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Longest single wait (in seconds) for Retry-After before retrying
+RETRY_AFTER_MAX = 10
+
+# Seconds after the first retry that a request stops being retried, so a
+# struggling server can't block a refresh for minutes
+RETRY_DEADLINE = 20
+
+# Longest wait (in seconds) for a primary rate limit to reset; anything
+# longer returns the 403 straight away
+RATE_LIMIT_WAIT_MAX = 5
+
+# Number of GET responses kept for ETag revalidation
+ETAG_CACHE_SIZE = 256
+
+REPO_STATUS_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    viewerHasStarred
+    viewerSubscription
+  }
+}
+"""
+
+# Branch names with head commit dates, 100 refs per page
+BRANCHES_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    refs(refPrefix: "refs/heads/", first: 100, after: $cursor) {
+      pageInfo { endCursor hasNextPage }
+      nodes {
+        name
+        target { ... on Commit { oid committedDate } }
+      }
+    }
+  }
+}
+"""
+
+# Fields shared by issues and pull requests in ISSUE_BUNDLE_QUERY
+_ISSUE_BUNDLE_FIELDS = """
+        __typename
+        databaseId
+        number
+        title
+        body
+        state
+        url
+        createdAt
+        updatedAt
+        closedAt
+        author { login avatarUrl ... on User { databaseId } }
+        labels(first: 100) { nodes { name color description } }
+        assignees(first: 100) { nodes { login databaseId avatarUrl } }
+        comments(first: 100) {
+          totalCount
+          nodes {
+            databaseId
+            body
+            url
+            createdAt
+            updatedAt
+            author { login avatarUrl ... on User { databaseId } }
+          }
+        }
+"""
+
+# An issue (or pull request) with its first 100 comments in one request
+ISSUE_BUNDLE_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    issueOrPullRequest(number: $number) {
+      ... on Issue {%s}
+      ... on PullRequest {%s}
+    }
+  }
+}
+""" % (_ISSUE_BUNDLE_FIELDS, _ISSUE_BUNDLE_FIELDS)
+
+
+class _CappedRetry(Retry):
+    """Retry that waits at most RETRY_AFTER_MAX for Retry-After.
+
+    Also retries 403s that carry Retry-After, which is how GitHub signals its
+    secondary rate limit. Retries stop RETRY_DEADLINE seconds after the first
+    one, however many attempts are left.
+    """
+
+    RETRY_AFTER_STATUS_CODES = frozenset({403, 413, 429, 503})
+
+    def __init__(self, *args, deadline=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.deadline = deadline
+
+    def new(self, **kw):
+        # The adapter's instance is shared, so the deadline starts on the copy
+        # made for a request's first retry and is carried to later copies
+        retry = super().new(**kw)
+        retry.deadline = self.deadline or time.monotonic() + RETRY_DEADLINE
+        return retry
+
+    def _time_left(self):
+        if self.deadline is None:
+            return RETRY_DEADLINE
+        return max(0, self.deadline - time.monotonic())
+
+    def is_exhausted(self):
+        return super().is_exhausted() or self._time_left() == 0
+
+    def get_backoff_time(self):
+        return min(super().get_backoff_time(), self._time_left())
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_MAX, self._time_left())
+
+
+class _SharedAdapter(HTTPAdapter):
+    """HTTPAdapter mounted on every account's session.
+
+    Session.close() closes its adapters, which would drop the pool for all
+    the other accounts too, so closing is a no-op here. The pools live for
+    the life of the process.
+    """
+
+    def close(self):
+        pass
+
+
+class _GitHubAdapter(_SharedAdapter):
+    """Shared adapter that also waits out a primary rate limit that resets soon.
+
+    A rate-limited 403 carries X-RateLimit-Reset rather than Retry-After, so
+    urllib3's Retry can't see it. Safe requests are resent once if the reset
+    is within RATE_LIMIT_WAIT_MAX; otherwise the 403 is returned as is.
+    """
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        if (response.status_code in (403, 429) and request.method in ("GET", "HEAD")
+                and response.headers.get("X-RateLimit-Remaining") == "0"):
+            reset = response.headers.get("X-RateLimit-Reset", "")
+            wait = int(reset) - time.time() if reset.isdigit() else None
+            if wait is not None and wait <= RATE_LIMIT_WAIT_MAX:
+                response.close()
+                time.sleep(max(0, wait) + 1)
+                response = super().send(request, **kwargs)
+        return response
+
+
+# One connection pool shared by every account's session, so accounts reuse
+# each other's warm TLS connections. Auth headers are per session, not per
+# pooled connection, and closing a session leaves the pool open. The pool has
+# room for concurrent page fetches plus calls from other threads.
+_ADAPTER = _GitHubAdapter(
+    pool_connections=4,
+    pool_maxsize=POOL_SIZE,
+    max_retries=_CappedRetry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        raise_on_status=False
+    )
+)
+
+# Quick status checks (STATUS_TIMEOUT) must fail fast rather than retry
+_QUICK_ADAPTER = _SharedAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+
 
 class AccountSetupCancelled(Exception):
     """Raised when user cancels account setup."""
     pass
 
 
+class AccountNeedsAuth(Exception):
+    """Raised when a non-interactive account load would need to prompt the user."""
+    pass
+
+
+class _CachedResponse:
+    """Minimal stand-in for a requests.Response with an already-parsed body."""
+
+    status_code = 200
+
+    def __init__(self, data, links):
+        self._data = data
+        self.links = links
+
+    def json(self):
+        return self._data
+
+
+def _parse_json(response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def _push_time(repo: Repository) -> float:
+    """Sort key: last push as a POSIX timestamp (0 if never pushed)."""
+    return repo.pushed_at.timestamp() if repo.pushed_at else 0.0
+
+
 def _exit_app():
     """Safely exit the application from within wxPython context."""
     raise AccountSetupCancelled()
@@ -120,25 +349,42 @@ class _AuthWaitDialog(wx.Dialog):
 class GitHubAccount:
     """GitHub account wrapper with authentication and API methods."""
 
-    def __init__(self, app, index):
+    def __init__(self, app, index, interactive=True):
         self.app = app
         self.index = index
+        self.interactive = interactive
         self.ready = False
         self.me = None
         self._session = requests.Session()
+        self._session.mount("https://", _ADAPTER)
+        # Same headers (so the same token), but no retries
+        self._quick_session = requests.Session()
+        self._quick_session.headers = self._session.headers
+        self._quick_session.mount("https://", _QUICK_ADAPTER)
+        # Star/watch status caches: (owner, repo) -> (value, expiry)
+        self._star_cache = {}
+        self._watch_cache = {}
+        # Permission level per (owner, repo), kept until invalidated
+        self._perm_cache = {}
+        # ETag cache for GETs: key -> (etag, parsed body, links), oldest first
+        self._etag_cache = OrderedDict()
+        self._etag_lock = threading.Lock()
 
         # Load config
         if config.is_portable_mode():
-            self.prefs = config.Config(name="account" + str(index), autosave=True)
-            self.confpath = self.prefs._user_config_home + "/account" + str(index)
+            self.prefs = config.Config(name="account" + str(index), autosave=False)
+            self.confpath = os.path.join(self.prefs._user_config_home, "account" + str(index))
         else:
-            self.prefs = config.Config(name="FastGH/account" + str(index), autosave=True)
-            self.confpath = self.prefs._user_config_home + "/FastGH/account" + str(index)
+            self.prefs = config.Config(name="FastGH/account" + str(index), autosave=False)
+            self.confpath = os.path.join(self.prefs._user_config_home, "FastGH", "account" + str(index))
 
         # Load or get access token
         self.prefs.access_token = self.prefs.get("access_token", "")
+        # Filling in the default above doesn't need a write; later changes do
+        self.prefs.set_autosave(True)
 
         if not self.prefs.access_token:
+            self._require_interactive()
             self._authenticate()
 
         # Set up authenticated session
@@ -153,6 +399,13 @@ class GitHubAccount:
 
         self.ready = True
 
+    def _require_interactive(self):
+        """Bail out of a non-interactive load before showing any dialog."""
+        if not self.interactive:
+            # Stop this Config from saving stale data over the interactive retry
+            self.prefs.discard()
+            raise AccountNeedsAuth()
+
     def _authenticate(self):
         """Perform OAuth Device Flow authentication."""
         if GITHUB_CLIENT_ID == "YOUR_CLIENT_ID_HERE":
@@ -165,30 +418,13 @@ class GitHubAccount:
             )
             _exit_app()
 
-        # Step 1: Request device code
-        response = requests.post(
-            "https://github.com/login/device/code",
-            data={
-                "client_id": GITHUB_CLIENT_ID,
-                "scope": "repo user notifications"
-            },
-            headers={"Accept": "application/json"}
-        )
-
-        if response.status_code != 200:
-            wx.MessageBox(
-                f"Failed to get device code: {response.text}",
-                "Authentication Error",
-                wx.OK | wx.ICON_ERROR
-            )
-            _exit_app()
-
-        data = response.json()
-        device_code = data["device_code"]
-        user_code = data["user_code"]
-        verification_uri = data["verification_uri"]
-        expires_in = data.get("expires_in", 900)
-        interval = data.get("interval", 5)
+        # Step 1: Request device code (or reuse one from an interrupted sign-in)
+        pending = self._get_device_code()
+        device_code = pending["device_code"]
+        user_code = pending["user_code"]
+        verification_uri = pending["verification_uri"]
+        expires_in = pending["expires_at"] - time.time()
+        interval = pending["interval"]
 
         # Step 2: Ask user if ready, then copy code
         result = wx.MessageBox(
@@ -220,13 +456,14 @@ class GitHubAccount:
 
         # Step 3: Poll for access token with custom dialog
         auth_dialog = _AuthWaitDialog(None, user_code, verification_uri, expires_in)
-        start_time = time.time()
+        # Monotonic so wall-clock adjustments can't end the wait early or late
+        deadline = time.monotonic() + expires_in
         access_token = None
 
         # Start polling in background
         def poll_for_token():
             nonlocal access_token, interval
-            while time.time() - start_time < expires_in:
+            while time.monotonic() < deadline:
                 if auth_dialog.cancelled:
                     break
 
@@ -250,12 +487,13 @@ class GitHubAccount:
                     elif token_data.get("error") == "authorization_pending":
                         pass
                     elif token_data.get("error") == "slow_down":
-                        interval += 5
+                        # GitHub sends the new interval; RFC 8628 says add 5s otherwise
+                        interval = token_data.get("interval", interval + 5)
                     elif token_data.get("error") in ("expired_token", "access_denied"):
                         wx.CallAfter(auth_dialog.on_error, token_data.get("error"))
                         return
 
-                time.sleep(interval)
+                time.sleep(max(0, min(interval, deadline - time.monotonic())))
 
             # Timed out
             if not access_token and not auth_dialog.cancelled:
@@ -267,24 +505,69 @@ class GitHubAccount:
         result = auth_dialog.ShowModal()
         auth_dialog.Destroy()
 
+        # The code can't be used again once it was redeemed, denied or expired
+        if access_token or auth_dialog.error:
+            self.prefs.pop("device_code", None)
+
         if result == wx.ID_CANCEL:
             _exit_app()
 
         # Save the token
         self.prefs.access_token = access_token
 
+    def _get_device_code(self) -> dict:
+        """Return a usable device code, requesting a new one if needed.
+
+        The code is kept in the account prefs until it is redeemed or expires,
+        so restarting mid-sign-in shows the same code instead of a new one.
+        """
+        pending = self.prefs.get("device_code")
+        if pending and pending["expires_at"] > time.time() + DEVICE_CODE_MARGIN:
+            return pending
+
+        response = requests.post(
+            "https://github.com/login/device/code",
+            data={
+                "client_id": GITHUB_CLIENT_ID,
+                "scope": "repo user notifications"
+            },
+            headers={"Accept": "application/json"}
+        )
+
+        if response.status_code != 200:
+            wx.MessageBox(
+                f"Failed to get device code: {response.text}",
+                "Authentication Error",
+                wx.OK | wx.ICON_ERROR
+            )
+            _exit_app()
+
+        data = response.json()
+        pending = {
+            "device_code": data["device_code"],
+            "user_code": data["user_code"],
+            "verification_uri": data["verification_uri"],
+            "interval": data.get("interval", 5),
+            # Wall clock, since it has to survive a restart
+            "expires_at": time.time() + data.get("expires_in", 900)
+        }
+        self.prefs.device_code = pending
+        return pending
+
     def _verify_credentials(self):
         """Verify credentials and get user info."""
         response = self._session.get(f"{GITHUB_API_URL}/user")
 
         if response.status_code == 401:
             # Token invalid, clear and re-authenticate
+            self._require_interactive()
             self.prefs.access_token = ""
             self._authenticate()
             self._session.headers["Authorization"] = f"Bearer {self.prefs.access_token}"
             response = self._session.get(f"{GITHUB_API_URL}/user")
 
         if response.status_code != 200:
+            self._require_interactive()
             wx.MessageBox(
                 f"Failed to verify credentials: {response.text}",
                 "Authentication Error",
@@ -294,111 +577,156 @@ class GitHubAccount:
 
         self.me = response.json()
 
-    def get_repos(self, sort="pushed", per_page=100) -> list[Repository]:
-        """Get user's repositories, sorted by last push time."""
-        repos = []
-        page = 1
-
-        while True:
-            response = self._session.get(
-                f"{GITHUB_API_URL}/user/repos",
-                params={
-                    "sort": sort,
-                    "direction": "desc",
-                    "per_page": per_page,
-                    "page": page,
-                    "affiliation": "owner,collaborator,organization_member"
-                }
-            )
+    def _cached_get(self, url: str, params: dict = None):
+        """GET with ETag revalidation.
 
-            if response.status_code != 200:
-                break
+        Sends If-None-Match for URLs fetched before; a 304 reply (which doesn't
+        count against the rate limit) is answered from the cache. Successful
+        responses come back as a _CachedResponse with the body already parsed;
+        anything else is the raw requests.Response.
 
-            data = response.json()
-            if not data:
-                break
+        The parsed body is shared with the cache, so callers must build new
+        lists and dicts rather than modify it.
+        """
+        key = url if not params else url + "?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+            if cached:
+                self._etag_cache.move_to_end(key)
 
-            for repo_data in data:
-                repos.append(Repository.from_github_api(repo_data))
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self._session.get(url, params=params, headers=headers)
 
-            if len(data) < per_page:
-                break
+        if response.status_code == 304 and cached:
+            return _CachedResponse(cached[1], cached[2])
+        if response.status_code != 200:
+            return response
+
+        data = _parse_json(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[key] = (etag, data, response.links)
+                self._etag_cache.move_to_end(key)
+                if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        return _CachedResponse(data, response.links)
+
+    def _paginate(self, url: str, params: dict, max_items: int = 0) -> list:
+        """Fetch every page of a list endpoint and return all items in order.
+
+        The first page's Link header gives the last page number, so the
+        remaining pages are requested concurrently. max_items (0 = all) limits
+        how many pages are fetched. A page that still fails after one more try
+        ends the list there, so items are only ever missing from the end.
+        """
+        response = self._cached_get(url, params)
+        if response.status_code != 200:
+            return []
+        items = response.json()
+        last_url = response.links.get("last", {}).get("url")
+        if not items or not last_url:
+            return items[:max_items] if max_items else list(items)
+
+        page_param = parse_qs(urlsplit(last_url).query).get("page")
+        if not page_param or not page_param[0].isdigit():
+            # Cursor-style links can't be fetched out of order; walk them instead
+            max_pages = ceil(max_items / params["per_page"]) if max_items else 0
+            items = self._follow_pages(url, params, max_pages=max_pages)
+            return items[:max_items] if max_items else items
+
+        last_page = int(page_param[0])
+        if max_items:
+            last_page = min(last_page, ceil(max_items / params["per_page"]))
+        if last_page < 2:
+            return items[:max_items] if max_items else list(items)
+
+        def fetch(page):
+            try:
+                r = self._cached_get(url, {**params, "page": page})
+            except requests.RequestException:
+                return None
+            return r.json() if r.status_code == 200 else None
 
-            page += 1
+        with ThreadPoolExecutor(max_workers=min(PAGE_WORKERS, last_page - 1)) as executor:
+            pages = [items, *executor.map(fetch, range(2, last_page + 1))]
 
-        return repos
+        # Retry failed pages one at a time; stop at the first that still fails
+        for index, page in enumerate(pages):
+            if page is None:
+                page = pages[index] = fetch(index + 1)
+            if page is None:
+                del pages[index:]
+                break
 
-    def get_starred(self, per_page=100) -> list[Repository]:
-        """Get user's starred repositories, sorted by last push time."""
-        repos = []
-        page = 1
+        # Copy the pages into one list allocated at its final size
+        total = sum(map(len, pages))
+        if max_items:
+            total = min(total, max_items)
+        result = [None] * total
+        pos = 0
+        for page in pages:
+            count = min(len(page), total - pos)
+            result[pos:pos + count] = page[:count]
+            pos += count
+            if pos == total:
+                break
+        return result
 
-        while True:
-            response = self._session.get(
-                f"{GITHUB_API_URL}/user/starred",
-                params={
-                    "per_page": per_page,
-                    "page": page
-                }
-            )
+    def _follow_pages(self, url: str, params: dict, key: str = None, max_pages: int = 0) -> list:
+        """Fetch a list endpoint page by page, following Link rel="next".
 
+        key names the list inside object-wrapped responses (e.g. 'jobs');
+        max_pages (0 = all) caps how many requests are made.
+        """
+        items = []
+        pages = 0
+        while url:
+            response = self._session.get(url, params=params)
             if response.status_code != 200:
                 break
-
-            data = response.json()
-            if not data:
+            data = _parse_json(response)
+            items.extend(data.get(key, []) if key else data)
+            pages += 1
+            if max_pages and pages >= max_pages:
                 break
+            # The next URL already carries the query string
+            url = response.links.get("next", {}).get("url")
+            params = None
+        return items
 
-            for repo_data in data:
-                repos.append(Repository.from_github_api(repo_data))
-
-            if len(data) < per_page:
-                break
+    def get_repos(self, sort="pushed", per_page=100) -> list[Repository]:
+        """Get user's repositories, sorted by last push time."""
+        data = self._paginate(
+            f"{GITHUB_API_URL}/user/repos",
+            {
+                "sort": sort,
+                "direction": "desc",
+                "per_page": per_page,
+                "affiliation": "owner,collaborator,organization_member"
+            }
+        )
+        return [Repository.from_github_api(repo_data) for repo_data in data]
 
-            page += 1
+    def get_starred(self, per_page=100) -> list[Repository]:
+        """Get user's starred repositories, sorted by last push time."""
+        data = self._paginate(f"{GITHUB_API_URL}/user/starred", {"per_page": per_page})
+        repos = [Repository.from_github_api(repo_data) for repo_data in data]
 
-        # Sort by pushed_at descending (use epoch for None values)
-        epoch = datetime(1970, 1, 1)
-        repos.sort(key=lambda r: r.pushed_at.replace(tzinfo=None) if r.pushed_at else epoch, reverse=True)
+        repos.sort(key=_push_time, reverse=True)
         return repos
 
     def get_watched(self, per_page=100) -> list[Repository]:
         """Get user's watched/subscribed repositories, sorted by last push time."""
-        repos = []
-        page = 1
-
-        while True:
-            response = self._session.get(
-                f"{GITHUB_API_URL}/user/subscriptions",
-                params={
-                    "per_page": per_page,
-                    "page": page
-                }
-            )
-
-            if response.status_code != 200:
-                break
-
-            data = response.json()
-            if not data:
-                break
-
-            for repo_data in data:
-                repos.append(Repository.from_github_api(repo_data))
+        data = self._paginate(f"{GITHUB_API_URL}/user/subscriptions", {"per_page": per_page})
+        repos = [Repository.from_github_api(repo_data) for repo_data in data]
 
-            if len(data) < per_page:
-                break
-
-            page += 1
-
-        # Sort by pushed_at descending (use epoch for None values)
-        epoch = datetime(1970, 1, 1)
-        repos.sort(key=lambda r: r.pushed_at.replace(tzinfo=None) if r.pushed_at else epoch, reverse=True)
+        repos.sort(key=_push_time, reverse=True)
         return repos
 
     def get_repo(self, owner: str, repo: str) -> Repository | None:
         """Get a single repository by owner and name."""
-        response = self._session.get(
+        response = self._cached_get(
             f"{GITHUB_API_URL}/repos/{owner}/{repo}"
         )
 
@@ -423,43 +751,21 @@ class GitHubAccount:
 
     def get_issues(self, owner: str, repo: str, state: str = "open", per_page: int = 100) -> list[Issue]:
         """Get issues for a repository."""
-        issues = []
-        page = 1
-
-        while True:
-            response = self._session.get(
-                f"{GITHUB_API_URL}/repos/{owner}/{repo}/issues",
-                params={
-                    "state": state,
-                    "per_page": per_page,
-                    "page": page,
-                    "sort": "updated",
-                    "direction": "desc"
-                }
-            )
-
-            if response.status_code != 200:
-                break
-
-            data = response.json()
-            if not data:
-                break
-
-            for item in data:
-                # Skip pull requests (they appear in issues endpoint too)
-                if 'pull_request' not in item:
-                    issues.append(Issue.from_github_api(item))
-
-            if len(data) < per_page:
-                break
-
-            page += 1
-
-        return issues
+        data = self._paginate(
+            f"{GITHUB_API_URL}/repos/{owner}/{repo}/issues",
+            {
+                "state": state,
+                "per_page": per_page,
+                "sort": "updated",
+                "direction": "desc"
+            }
+        )
+        # Skip pull requests (they appear in issues endpoint too)
+        return [Issue.from_github_api(item) for item in data if 'pull_request' not in item]
 
     def get_issue(self, owner: str, repo: str, number: int) -> Issue | None:
         """Get a single issue by number."""
-        response = self._session.get(
+        response = self._cached_get(
             f"{GITHUB_API_URL}/repos/{owner}/{repo}/issues/{number}"
         )
 
@@ -468,6 +774,37 @@ class GitHubAccount:
 
         return Issue.from_github_api(response.json())
 
+    def get_issue_bundle(self, owner: str, repo: str, number: int) -> tuple[Issue | None, list[Comment] | None]:
+        """Get an issue and its comments in a single GraphQL request.
+
+        Returns:
+            (issue, comments). comments is None when they weren't fetched
+            (more than 100, or the GraphQL query failed and the issue came
+            from REST) and should be loaded with get_issue_comments.
+        """
+        try:
+            response = self._session.post(
+                f"{GITHUB_API_URL}/graphql",
+                json={
+                    "query": ISSUE_BUNDLE_QUERY,
+                    "variables": {"owner": owner, "name": repo, "number": number}
+                }
+            )
+        except requests.RequestException:
+            response = None
+
+        node = None
+        if response is not None and response.status_code == 200:
+            node = ((_parse_json(response).get("data") or {}).get("repository") or {}).get("issueOrPullRequest")
+        if not node:
+            return self.get_issue(owner, repo, number), None
+
+        issue = Issue.from_graphql(node)
+        comments = node["comments"]
+        if comments["totalCount"] > len(comments["nodes"]):
+            return issue, None
+        return issue, [Comment.from_graphql(c) for c in comments["nodes"]]
+
     def create_issue(self, owner: str, repo: str, title: str, body: str = "", labels: list[str] = None) -> Issue | None:
         """Create a new issue."""
         data = {"title": title, "body": body}
@@ -516,34 +853,11 @@ class GitHubAccount:
 
     def get_issue_comments(self, owner: str, repo: str, number: int, per_page: int = 100) -> list[Comment]:
         """Get comments on an issue."""
-        comments = []
-        page = 1
-
-        while True:
-            response = self._session.get(
-                f"{GITHUB_API_URL}/repos/{owner}/{repo}/issues/{number}/comments",
-                params={
-                    "per_page": per_page,
-                    "page": page
-                }
-            )
-
-            if response.status_code != 200:
-                break
-
-            data = response.json()
-            if not data:
-                break
-
-            for item in data:
-                comments.append(Comment.from_github_api(item))
-
-            if len(data) < per_page:
-                break
-
-            page += 1
-
-        return comments
+        data = self._paginate(
+            f"{GITHUB_API_URL}/repos/{owner}/{repo}/issues/{number}/comments",
+            {"per_page": per_page}
+        )
+        return [Comment.from_github_api(item) for item in data]
 
     def create_issue_comment(self, owner: str, repo: str, number: int, body: str) -> Comment | None:
         """Create a comment on an issue."""
@@ -568,41 +882,20 @@ class GitHubAccount:
 
     def get_pull_requests(self, owner: str, repo: str, state: str = "open", per_page: int = 100) -> list[PullRequest]:
         """Get pull requests for a repository."""
-        prs = []
-        page = 1
-
-        while True:
-            response = self._session.get(
-                f"{GITHUB_API_URL}/repos/{owner}/{repo}/pulls",
-                params={
-                    "state": state,
-                    "per_page": per_page,
-                    "page": page,
-                    "sort": "updated",
-                    "direction": "desc"
-                }
-            )
-
-            if response.status_code != 200:
-                break
-
-            data = response.json()
-            if not data:
-                break
-
-            for item in data:
-                prs.append(PullRequest.from_github_api(item))
-
-            if len(data) < per_page:
-                break
-
-            page += 1
-
-        return prs
+        data = self._paginate(
+            f"{GITHUB_API_URL}/repos/{owner}/{repo}/pulls",
+            {
+                "state": state,
+                "per_page": per_page,
+                "sort": "updated",
+                "direction": "desc"
+            }
+        )
+        return [PullRequest.from_github_api(item) for item in data]
 
     def get_pull_request(self, owner: str, repo: str, number: int) -> PullRequest | None:
         """Get a single pull request by number."""
-        response = self._session.get(
+        response = self._cached_get(
             f"{GITHUB_API_URL}/repos/{owner}/{repo}/pulls/{number}"
         )
 
@@ -674,9 +967,30 @@ class GitHubAccount:
         result = self.update_pull_request(owner, repo, number, state="closed")
         return result is not None
 
-    def get_pr_comments(self, owner: str, repo: str, number: int, per_page: int = 100) -> list[Comment]:
-        """Get comments on a pull request (issue comments, not review comments)."""
-        return self.get_issue_comments(owner, repo, number, per_page)
+    def get_pr_comments(self, owner: str, repo: str, number: int, per_page: int = 100,
+                        include_reviews: bool = False) -> list[Comment]:
+        """Get comments on a pull request.
+
+        Only conversation (issue) comments unless include_reviews is set,
+        which also fetches review comments and merges both by creation time.
+        """
+        if not include_reviews:
+            return self.get_issue_comments(owner, repo, number, per_page)
+        return self.get_pr_all_comments(owner, repo, number, per_page)
+
+    def get_pr_all_comments(self, owner: str, repo: str, number: int, per_page: int = 100) -> list[Comment]:
+        """Get conversation and review comments on a pull request, oldest first."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            review_future = executor.submit(
+                self._paginate,
+                f"{GITHUB_API_URL}/repos/{owner}/{repo}/pulls/{number}/comments",
+                {"per_page": per_page}
+            )
+            comments = self.get_issue_comments(owner, repo, number, per_page)
+            comments.extend(Comment.from_github_api(item) for item in review_future.result())
+
+        comments.sort(key=lambda c: c.created_at.timestamp() if c.created_at else 0.0)
+        return comments
 
     def create_pr_comment(self, owner: str, repo: str, number: int, body: str) -> Comment | None:
         """Create a comment on a pull request."""
@@ -689,7 +1003,11 @@ class GitHubAccount:
 
         Returns: 'admin', 'write', 'read', or None if no access
         """
-        response = self._session.get(
+        key = self._status_key(owner, repo)
+        if key in self._perm_cache:
+            return self._perm_cache[key]
+
+        response = self._cached_get(
             f"{GITHUB_API_URL}/repos/{owner}/{repo}"
         )
 
@@ -700,12 +1018,19 @@ class GitHubAccount:
         permissions = data.get('permissions', {})
 
         if permissions.get('admin'):
-            return 'admin'
+            permission = 'admin'
         elif permissions.get('push'):
-            return 'write'
+            permission = 'write'
         elif permissions.get('pull'):
-            return 'read'
-        return None
+            permission = 'read'
+        else:
+            permission = None
+        self._perm_cache[key] = permission
+        return permission
+
+    def invalidate_permissions(self, owner: str, repo: str):
+        """Forget the cached permission level for a repository."""
+        self._perm_cache.pop(self._status_key(owner, repo), None)
 
     def can_merge(self, owner: str, repo: str) -> bool:
         """Check if current user can merge PRs in this repository."""
@@ -724,50 +1049,26 @@ class GitHubAccount:
             per_page: Number of commits per page
             max_commits: Maximum number of commits to return (0 = all)
         """
-        commits = []
-        page = 1
-
-        # Optimize per_page if max_commits is set and smaller
-        if max_commits > 0 and max_commits < per_page:
-            per_page = max_commits
+        # Spread max_commits evenly over the fewest pages so the last page
+        # isn't mostly discarded (250 -> 3 pages of 84, not 3 of 100)
+        if max_commits > 0:
+            pages = ceil(max_commits / per_page)
+            per_page = ceil(max_commits / pages)
 
-        params = {
-            "per_page": per_page,
-            "page": page
-        }
+        params = {"per_page": per_page}
         if sha:
             params["sha"] = sha
 
-        while True:
-            params["page"] = page
-            response = self._session.get(
-                f"{GITHUB_API_URL}/repos/{owner}/{repo}/commits",
-                params=params
-            )
-
-            if response.status_code != 200:
-                break
-
-            data = response.json()
-            if not data:
-                break
-
-            for item in data:
-                commits.append(Commit.from_github_api(item))
-                # Check if we've reached the limit
-                if max_commits > 0 and len(commits) >= max_commits:
-                    return commits
-
-            if len(data) < per_page:
-                break
-
-            page += 1
-
-        return commits
+        data = self._paginate(
+            f"{GITHUB_API_URL}/repos/{owner}/{repo}/commits",
+            params,
+            max_items=max_commits
+        )
+        return [Commit.from_github_api(item) for item in data]
 
     def get_commit(self, owner: str, repo: str, sha: str) -> Commit | None:
         """Get a single commit by SHA."""
-        response = self._session.get(
+        response = self._cached_get(
             f"{GITHUB_API_URL}/repos/{owner}/{repo}/commits/{sha}"
         )
 
@@ -776,50 +1077,76 @@ class GitHubAccount:
 
         return Commit.from_github_api(response.json())
 
-    def get_branches(self, owner: str, repo: str, per_page: int = 100) -> list[dict]:
-        """Get branches for a repository, sorted by last commit date (most recent first)."""
-        branches = []
-        page = 1
+    def _get_branches_graphql(self, owner: str, repo: str) -> list[dict] | None:
+        """Get branches with their head commit dates via GraphQL.
 
+        Returns dicts shaped like the REST branch list plus last_commit_date,
+        or None if the query failed.
+        """
+        branches = []
+        cursor = None
         while True:
-            response = self._session.get(
-                f"{GITHUB_API_URL}/repos/{owner}/{repo}/branches",
-                params={
-                    "per_page": per_page,
-                    "page": page
-                }
-            )
-
+            try:
+                response = self._session.post(
+                    f"{GITHUB_API_URL}/graphql",
+                    json={
+                        "query": BRANCHES_QUERY,
+                        "variables": {"owner": owner, "name": repo, "cursor": cursor}
+                    }
+                )
+            except requests.RequestException:
+                return None
             if response.status_code != 200:
-                break
+                return None
 
-            data = response.json()
-            if not data:
-                break
+            body = _parse_json(response)
+            repository = (body.get("data") or {}).get("repository")
+            if body.get("errors") or not repository:
+                return None
 
-            branches.extend(data)
+            refs = repository["refs"]
+            for node in refs["nodes"]:
+                target = node.get("target") or {}
+                branches.append({
+                    'name': node["name"],
+                    'commit': {'sha': target.get("oid")},
+                    'last_commit_date': target.get("committedDate")
+                })
 
-            if len(data) < per_page:
-                break
+            page_info = refs["pageInfo"]
+            if not page_info["hasNextPage"]:
+                return branches
+            cursor = page_info["endCursor"]
 
-            page += 1
+    def get_branches(self, owner: str, repo: str, per_page: int = 100) -> list[dict]:
+        """Get branches for a repository, sorted by last commit date (most recent first)."""
+        branches = self._get_branches_graphql(owner, repo)
+        if branches is not None:
+            branches.sort(key=lambda b: b.get('last_commit_date') or '', reverse=True)
+            return branches
+
+        # Fall back to REST, which needs one commit lookup per branch
+        branches = self._paginate(
+            f"{GITHUB_API_URL}/repos/{owner}/{repo}/branches",
+            {"per_page": per_page}
+        )
 
-        # Fetch commit dates for sorting
+        # Fetch commit dates for sorting. The branch dicts belong to the ETag
+        # cache, so the date goes on a copy.
+        dated = []
         for branch in branches:
+            commit_date = None
             commit_sha = branch.get('commit', {}).get('sha')
             if commit_sha:
                 # Get commit info to get the date
-                response = self._session.get(
+                response = self._cached_get(
                     f"{GITHUB_API_URL}/repos/{owner}/{repo}/commits/{commit_sha}"
                 )
                 if response.status_code == 200:
                     commit_data = response.json()
                     commit_date = commit_data.get('commit', {}).get('committer', {}).get('date')
-                    branch['last_commit_date'] = commit_date
-                else:
-                    branch['last_commit_date'] = None
-            else:
-                branch['last_commit_date'] = None
+            dated.append({**branch, 'last_commit_date': commit_date})
+        branches = dated
 
         # Sort by last commit date (most recent first), None values at end
         branches.sort(
@@ -918,7 +1245,7 @@ class GitHubAccount:
 
     def get_user(self, username: str) -> UserProfile | None:
         """Get a user's profile."""
-        response = self._session.get(
+        response = self._cached_get(
             f"{GITHUB_API_URL}/users/{username}"
         )
 
@@ -929,86 +1256,43 @@ class GitHubAccount:
 
     def get_user_repos(self, username: str, sort: str = "pushed", per_page: int = 100) -> list[Repository]:
         """Get a user's public repositories."""
-        repos = []
-        page = 1
-
-        while True:
-            response = self._session.get(
-                f"{GITHUB_API_URL}/users/{username}/repos",
-                params={
-                    "sort": sort,
-                    "direction": "desc",
-                    "per_page": per_page,
-                    "page": page
-                }
-            )
-
-            if response.status_code != 200:
-                break
-
-            data = response.json()
-            if not data:
-                break
-
-            for repo_data in data:
-                repos.append(Repository.from_github_api(repo_data))
-
-            if len(data) < per_page:
-                break
-
-            page += 1
-
-        return repos
+        data = self._paginate(
+            f"{GITHUB_API_URL}/users/{username}/repos",
+            {
+                "sort": sort,
+                "direction": "desc",
+                "per_page": per_page
+            }
+        )
+        return [Repository.from_github_api(repo_data) for repo_data in data]
 
     # ============ Following API ============
 
     def get_following(self, per_page: int = 100) -> list[UserProfile]:
         """Get users the authenticated user is following."""
+        data = self._paginate(f"{GITHUB_API_URL}/user/following", {"per_page": per_page})
         users = []
-        page = 1
-
-        while True:
-            response = self._session.get(
-                f"{GITHUB_API_URL}/user/following",
-                params={
-                    "per_page": per_page,
-                    "page": page
-                }
-            )
-
-            if response.status_code != 200:
-                break
-
-            data = response.json()
-            if not data:
-                break
-
-            for item in data:
-                users.append(UserProfile(
-                    id=item.get('id', 0),
-                    login=item.get('login', ''),
-                    name=None,
-                    avatar_url=item.get('avatar_url', ''),
-                    html_url=item.get('html_url', ''),
-                    bio=None,
-                    company=None,
-                    location=None,
-                    email=None,
-                    blog=None,
-                    twitter_username=None,
-                    public_repos=0,
-                    public_gists=0,
-                    followers=0,
-                    following=0,
-                    created_at=None,
-                    updated_at=None,
-                    type=item.get('type', 'User')
-                ))
-
-            if len(data) < per_page:
-                break
-
-            page += 1
+        for item in data:
+            users.append(UserProfile(
+                id=item.get('id', 0),
+                login=item.get('login', ''),
+                name=None,
+                avatar_url=item.get('avatar_url', ''),
+                html_url=item.get('html_url', ''),
+                bio=None,
+                company=None,
+                location=None,
+                email=None,
+                blog=None,
+                twitter_username=None,
+                public_repos=0,
+                public_gists=0,
+                followers=0,
+                following=0,
+                created_at=None,
+                updated_at=None,
+                type=item.get('type', 'User')
+            ))
 
         return users
 
@@ -1033,13 +1317,81 @@ class GitHubAccount:
         )
         return response.status_code == 204
 
+    # ============ Star/Watch Status ============
+
+    @staticmethod
+    def _status_key(owner: str, repo: str) -> tuple[str, str]:
+        """Cache key for per-repo star/watch status."""
+        return (owner.lower(), repo.lower())
+
+    @staticmethod
+    def _get_cached_status(cache: dict, key) -> bool | None:
+        """Return a cached status value, or None if missing or expired."""
+        entry = cache.get(key)
+        if entry and time.monotonic() < entry[1]:
+            return entry[0]
+        return None
+
+    @staticmethod
+    def _set_cached_status(cache: dict, key, value: bool):
+        """Cache a status value for REPO_STATUS_TTL seconds."""
+        cache[key] = (value, time.monotonic() + REPO_STATUS_TTL)
+
+    def get_repo_user_status(self, owner: str, repo: str) -> tuple[bool, bool] | None:
+        """Get whether the user has starred and is watching a repository.
+
+        Uses a single GraphQL query instead of two REST calls. Results share
+        the star/watch caches used by is_starred and is_watching.
+
+        Returns:
+            (starred, watching) tuple, or None if the query failed
+        """
+        key = self._status_key(owner, repo)
+        starred = self._get_cached_status(self._star_cache, key)
+        watching = self._get_cached_status(self._watch_cache, key)
+        if starred is not None and watching is not None:
+            return starred, watching
+
+        try:
+            response = self._quick_session.post(
+                f"{GITHUB_API_URL}/graphql",
+                json={"query": REPO_STATUS_QUERY, "variables": {"owner": owner, "name": repo}},
+                timeout=STATUS_TIMEOUT
+            )
+        except requests.RequestException:
+            return None
+
+        if response.status_code != 200:
+            return None
+
+        data = (response.json().get("data") or {}).get("repository")
+        if not data:
+            return None
+
+        # REST treats any subscription (including ignored) as watching
+        subscription = data.get("viewerSubscription")
+        starred = bool(data.get("viewerHasStarred"))
+        watching = subscription not in (None, "UNSUBSCRIBED")
+        self._set_cached_status(self._star_cache, key, starred)
+        self._set_cached_status(self._watch_cache, key, watching)
+        return starred, watching
+
     # ============ Starring API ============
 
     def is_starred(self, owner: str, repo: str) -> bool:
         """Check if authenticated user has starred a repository."""
-        response = self._session.get(
-            f"{GITHUB_API_URL}/user/starred/{owner}/{repo}"
+        key = self._status_key(owner, repo)
+        cached = self._get_cached_status(self._star_cache, key)
+        if cached is not None:
+            return cached
+
+        response = self._quick_session.get(
+            f"{GITHUB_API_URL}/user/starred/{owner}/{repo}",
+            timeout=STATUS_TIMEOUT
         )
+        # Only 204 (starred) and 404 (not starred) are definitive
+        if response.status_code in (204, 404):
+            self._set_cached_status(self._star_cache, key, response.status_code == 204)
         return response.status_code == 204
 
     def star_repo(self, owner: str, repo: str) -> bool:
@@ -1047,22 +1399,37 @@ class GitHubAccount:
         response = self._session.put(
             f"{GITHUB_API_URL}/user/starred/{owner}/{repo}"
         )
-        return response.status_code == 204
+        if response.status_code == 204:
+            self._set_cached_status(self._star_cache, self._status_key(owner, repo), True)
+            return True
+        return False
 
     def unstar_repo(self, owner: str, repo: str) -> bool:
         """Unstar a repository."""
         response = self._session.delete(
             f"{GITHUB_API_URL}/user/starred/{owner}/{repo}"
         )
-        return response.status_code == 204
+        if response.status_code == 204:
+            self._set_cached_status(self._star_cache, self._status_key(owner, repo), False)
+            return True
+        return False
 
     # ============ Watching API ============
 
     def is_watching(self, owner: str, repo: str) -> bool:
         """Check if authenticated user is watching a repository."""
-        response = self._session.get(
-            f"{GITHUB_API_URL}/repos/{owner}/{repo}/subscription"
+        key = self._status_key(owner, repo)
+        cached = self._get_cached_status(self._watch_cache, key)
+        if cached is not None:
+            return cached
+
+        response = self._quick_session.get(
+            f"{GITHUB_API_URL}/repos/{owner}/{repo}/subscription",
+            timeout=STATUS_TIMEOUT
         )
+        # Only 200 (subscribed) and 404 (not subscribed) are definitive
+        if response.status_code in (200, 404):
+            self._set_cached_status(self._watch_cache, key, response.status_code == 200)
         return response.status_code == 200
 
     def watch_repo(self, owner: str, repo: str) -> bool:
@@ -1071,48 +1438,31 @@ class GitHubAccount:
             f"{GITHUB_API_URL}/repos/{owner}/{repo}/subscription",
             json={"subscribed": True}
         )
-        return response.status_code == 200
+        if response.status_code == 200:
+            self._set_cached_status(self._watch_cache, self._status_key(owner, repo), True)
+            return True
+        return False
 
     def unwatch_repo(self, owner: str, repo: str) -> bool:
         """Unwatch a repository (unsubscribe from notifications)."""
         response = self._session.delete(
             f"{GITHUB_API_URL}/repos/{owner}/{repo}/subscription"
         )
-        return response.status_code == 204
+        if response.status_code == 204:
+            self._set_cached_status(self._watch_cache, self._status_key(owner, repo), False)
+            return True
+        return False
 
     # ============ Actions API ============
 
     def get_workflows(self, owner: str, repo: str, per_page: int = 100) -> list[Workflow]:
         """Get workflows for a repository."""
-        workflows = []
-        page = 1
-
-        while True:
-            response = self._session.get(
-                f"{GITHUB_API_URL}/repos/{owner}/{repo}/actions/workflows",
-                params={
-                    "per_page": per_page,
-                    "page": page
-                }
-            )
-
-            if response.status_code != 200:
-                break
-
-            data = response.json()
-            items = data.get('workflows', [])
-            if not items:
-                break
-
-            for item in items:
-                workflows.append(Workflow.from_github_api(item))
-
-            if len(items) < per_page:
-                break
-
-            page += 1
-
-        return workflows
+        items = self._follow_pages(
+            f"{GITHUB_API_URL}/repos/{owner}/{repo}/actions/workflows",
+            {"per_page": per_page},
+            key='workflows'
+        )
+        return [Workflow.from_github_api(item) for item in items]
 
     def get_workflow_runs(self, owner: str, repo: str, workflow_id: int = None,
                           branch: str = None, status: str = None, per_page: int = 30) -> list[WorkflowRun]:
@@ -1163,35 +1513,12 @@ class GitHubAccount:
 
     def get_workflow_run_jobs(self, owner: str, repo: str, run_id: int, per_page: int = 100) -> list[WorkflowJob]:
         """Get jobs for a workflow run."""
-        jobs = []
-        page = 1
-
-        while True:
-            response = self._session.get(
-                f"{GITHUB_API_URL}/repos/{owner}/{repo}/actions/runs/{run_id}/jobs",
-                params={
-                    "per_page": per_page,
-                    "page": page
-                }
-            )
-
-            if response.status_code != 200:
-                break
-
-            data = response.json()
-            items = data.get('jobs', [])
-            if not items:
-                break
-
-            for item in items:
-                jobs.append(WorkflowJob.from_github_api(item))
-
-            if len(items) < per_page:
-                break
-
-            page += 1
-
-        return jobs
+        items = self._follow_pages(
+            f"{GITHUB_API_URL}/repos/{owner}/{repo}/actions/runs/{run_id}/jobs",
+            {"per_page": per_page},
+            key='jobs'
+        )
+        return [WorkflowJob.from_github_api(item) for item in items]
 
     def rerun_workflow(self, owner: str, repo: str, run_id: int) -> bool:
         """Re-run a workflow."""
@@ -1250,34 +1577,11 @@ class GitHubAccount:
 
     def get_releases(self, owner: str, repo: str, per_page: int = 30) -> list[Release]:
         """Get releases for a repository."""
-        releases = []
-        page = 1
-
-        while True:
-            response = self._session.get(
-                f"{GITHUB_API_URL}/repos/{owner}/{repo}/releases",
-                params={
-                    "per_page": per_page,
-                    "page": page
-                }
-            )
-
-            if response.status_code != 200:
-                break
-
-            data = response.json()
-            if not data:
-                break
-
-            for item in data:
-                releases.append(Release.from_github_api(item))
-
-            if len(data) < per_page:
-                break
-
-            page += 1
-
-        return releases
+        data = self._follow_pages(
+            f"{GITHUB_API_URL}/repos/{owner}/{repo}/releases",
+            {"per_page": per_page}
+        )
+        return [Release.from_github_api(item) for item in data]
 
     def get_release(self, owner: str, repo: str, release_id: int) -> Release | None:
         """Get a single release by ID."""
@@ -1363,78 +1667,26 @@ class GitHubAccount:
             participating: Only show where you're directly involved
             per_page: Results per page
         """
-        notifications = []
-        page = 1
-
-        while True:
-            params = {
-                "per_page": per_page,
-                "page": page
-            }
-            if all:
-                params["all"] = "true"
-            if participating:
-                params["participating"] = "true"
-
-            response = self._session.get(
-                f"{GITHUB_API_URL}/notifications",
-                params=params
-            )
-
-            if response.status_code != 200:
-                break
-
-            data = response.json()
-            if not data:
-                break
-
-            for item in data:
-                notifications.append(Notification.from_api(item))
-
-            if len(data) < per_page:
-                break
-
-            page += 1
+        params = {"per_page": per_page}
+        if all:
+            params["all"] = "true"
+        if participating:
+            params["participating"] = "true"
 
-        return notifications
+        data = self._follow_pages(f"{GITHUB_API_URL}/notifications", params)
+        return [Notification.from_api(item) for item in data]
 
     def get_repo_notifications(self, owner: str, repo: str, all: bool = False,
                                participating: bool = False, per_page: int = 50) -> list[Notification]:
         """Get notifications for a specific repository."""
-        notifications = []
-        page = 1
-
-        while True:
-            params = {
-                "per_page": per_page,
-                "page": page
-            }
-            if all:
-                params["all"] = "true"
-            if participating:
-                params["participating"] = "true"
-
-            response = self._session.get(
-                f"{GITHUB_API_URL}/repos/{owner}/{repo}/notifications",
-                params=params
-            )
-
-            if response.status_code != 200:
-                break
-
-            data = response.json()
-            if not data:
-                break
-
-            for item in data:
-                notifications.append(Notification.from_api(item))
-
-            if len(data) < per_page:
-                break
-
-            page += 1
+        params = {"per_page": per_page}
+        if all:
+            params["all"] = "true"
+        if participating:
+            params["participating"] = "true"
 
-        return notifications
+        data = self._follow_pages(f"{GITHUB_API_URL}/repos/{owner}/{repo}/notifications", params)
+        return [Notification.from_api(item) for item in data]
 
     def mark_notifications_read(self, last_read_at: str = None) -> bool:
         """Mark all notifications as read.
@@ -1521,34 +1773,12 @@ class GitHubAccount:
 
         Note: GitHub limits this to 300 events max (10 pages of 30, or 3 pages of 100).
         """
-        events = []
-        page = 1
-
-        while page <= max_pages:
-            response = self._session.get(
-                f"{GITHUB_API_URL}/users/{self.username}/received_events",
-                params={
-                    "per_page": per_page,
-                    "page": page
-                }
-            )
-
-            if response.status_code != 200:
-                break
-
-            data = response.json()
-            if not data:
-                break
-
-            for item in data:
-                events.append(Event.from_api(item))
-
-            if len(data) < per_page:
-                break
-
-            page += 1
-
-        return events
+        data = self._follow_pages(
+            f"{GITHUB_API_URL}/users/{self.username}/received_events",
+            {"per_page": per_page},
+            max_pages=max_pages
+        )
+        return [Event.from_api(item) for item in data]
 
     def get_user_events(self, username: str, per_page: int = 30) -> list[Event]:
         """Get events performed by a specific user."""
@@ -1709,32 +1939,8 @@ class GitHubAccount:
         Returns:
             List of Repository objects representing the forks
         """
-        forks = []
-        page = 1
-
-        while True:
-            response = self._session.get(
-                f"{GITHUB_API_URL}/repos/{owner}/{repo}/forks",
-                params={
-                    "sort": sort,
-                    "per_page": per_page,
-                    "page": page
-                }
-            )
-
-            if response.status_code != 200:
-                break
-
-            data = response.json()
-            if not data:
-                break
-
-            for item in data:
-                forks.append(Repository.from_github_api(item))
-
-            if len(data) < per_page:
-                break
-
-            page += 1
-
-        return forks
+        data = self._follow_pages(
+            f"{GITHUB_API_URL}/repos/{owner}/{repo}/forks",
+            {"sort": sort, "per_page": per_page}
+        )
+        return [Repository.from_github_api(item) for item in data]
@@ -5,6 +5,16 @@ from datetime import datetime
 from typing import Optional
 
 
+def _parse_graphql_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse a GraphQL DateTime string, or return None."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return None
+
+
 @dataclass
 class User:
     """GitHub user model."""
@@ -22,6 +32,16 @@ class User:
             avatar_url=data.get('avatar_url', '')
         )
 
+    @classmethod
+    def from_graphql(cls, data: dict) -> 'User':
+        if not data:
+            return cls(login="unknown", id=0)
+        return cls(
+            login=data.get('login', 'unknown'),
+            id=data.get('databaseId') or 0,
+            avatar_url=data.get('avatarUrl', '')
+        )
+
 
 @dataclass
 class Label:
@@ -48,6 +68,19 @@ class Comment:
     created_at: Optional[datetime]
     updated_at: Optional[datetime]
     html_url: str = ""
+    # Set only for pull request review comments, which are attached to a diff
+    path: str = ""
+    line: Optional[int] = None
+
+    @property
+    def is_review_comment(self) -> bool:
+        return bool(self.path)
+
+    def format_location(self) -> str:
+        """Format a review comment's file and line, e.g. 'src/app.py:42'."""
+        if not self.path:
+            return ""
+        return f"{self.path}:{self.line}" if self.line else self.path
 
     @classmethod
     def from_github_api(cls, data: dict) -> 'Comment':
@@ -71,7 +104,20 @@ class Comment:
             user=User.from_github_api(data.get('user')),
             created_at=created_at,
             updated_at=updated_at,
-            html_url=data.get('html_url', '')
+            html_url=data.get('html_url', ''),
+            path=data.get('path') or '',
+            line=data.get('line') or data.get('original_line')
+        )
+
+    @classmethod
+    def from_graphql(cls, data: dict) -> 'Comment':
+        return cls(
+            id=data.get('databaseId') or 0,
+            body=data.get('body', ''),
+            user=User.from_graphql(data.get('author')),
+            created_at=_parse_graphql_time(data.get('createdAt')),
+            updated_at=_parse_graphql_time(data.get('updatedAt')),
+            html_url=data.get('url', '')
         )
 
 
@@ -136,6 +182,27 @@ class Issue:
             is_pull_request='pull_request' in data
         )
 
+    @classmethod
+    def from_graphql(cls, data: dict) -> 'Issue':
+        """Build an Issue from an issueOrPullRequest node."""
+        return cls(
+            id=data.get('databaseId') or 0,
+            number=data['number'],
+            title=data['title'],
+            body=data.get('body'),
+            # Merged pull requests read as closed, like the REST issues API
+            state='open' if data.get('state') == 'OPEN' else 'closed',
+            user=User.from_graphql(data.get('author')),
+            labels=[Label.from_github_api(l) for l in data['labels']['nodes']],
+            assignees=[User.from_graphql(a) for a in data['assignees']['nodes']],
+            comments_count=data['comments']['totalCount'],
+            created_at=_parse_graphql_time(data.get('createdAt')),
+            updated_at=_parse_graphql_time(data.get('updatedAt')),
+            closed_at=_parse_graphql_time(data.get('closedAt')),
+            html_url=data.get('url', ''),
+            is_pull_request=data.get('__typename') == 'PullRequest'
+        )
+
     def format_display(self) -> str:
         """Format issue for list display."""
         state_icon = "[Open]" if self.state == "open" else "[Closed]"
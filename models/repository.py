@@ -1,9 +1,19 @@
 """Repository data model."""
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime
 from typing import Optional
 
+# Most Repository objects kept for reuse when the same API data comes back
+INTERN_SIZE = 4096
+
+# (id, updated_at, pushed_at, counts) -> Repository, oldest first
+_intern = OrderedDict()
+_intern_lock = threading.Lock()
+
 
 @dataclass
 class Repository:
@@ -25,7 +35,35 @@ class Repository:
 
     @classmethod
     def from_github_api(cls, data: dict) -> 'Repository':
-        """Create a Repository from GitHub API response data."""
+        """Create a Repository from GitHub API response data.
+
+        A repo that shows up unchanged in several lists (owned, starred,
+        watched) or across refreshes returns the same instance.
+        """
+        # updated_at doesn't move on push or issue activity, so key those too
+        key = (
+            data['id'],
+            data.get('updated_at'),
+            data.get('pushed_at'),
+            data.get('stargazers_count'),
+            data.get('forks_count'),
+            data.get('open_issues_count')
+        )
+        with _intern_lock:
+            repo = _intern.get(key)
+            if repo is not None:
+                _intern.move_to_end(key)
+                return repo
+
+        repo = cls._from_github_api(data)
+        with _intern_lock:
+            _intern[key] = repo
+            if len(_intern) > INTERN_SIZE:
+                _intern.popitem(last=False)
+        return repo
+
+    @classmethod
+    def _from_github_api(cls, data: dict) -> 'Repository':
         updated_at = None
         if data.get('updated_at'):
             try:
@@ -57,6 +95,11 @@ class Repository:
             private=data.get('private', False),
         )
 
+    @cached_property
+    def clone_url(self) -> str:
+        """HTTPS URL for git clone."""
+        return f"https://github.com/{self.full_name}.git"
+
     def format_display(self) -> str:
         """Format repository for display in list."""
         desc = self.description or "No description"